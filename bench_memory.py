@@ -0,0 +1,113 @@
+# bench_memory.py
+# 행 수별 리포트 생성 최대 메모리(RSS) 비교 벤치마크
+#
+# 페이지 경로별 분석 섹션(개수 제한 없음)을 포함한 리포트를 main.py의 기본 경로
+# (run_command → 실행 기록(SQLite 파일) → 노션 페이지 생성/블록 추가 → 렌더링 기록 저장)로 만들어
+# 기존 방식과 메모리 절약 모드(--memory-bounded)의 프로세스 최대 RSS를 비교합니다.
+# 측정이 서로 영향을 주지 않도록 행 수/방식마다 별도 프로세스에서 실행합니다.
+#
+# GA와 노션은 호출하지 않습니다 (loadtest의 가짜 GA 클라이언트와 요청 본문만 읽는 세션 사용).
+# 실행 기록과 렌더링 기록은 임시 디렉터리에 만들고 크기도 함께 출력합니다.
+#
+# 실행: python bench_memory.py
+
+import os
+import sys
+import json
+import time
+import datetime
+import resource
+import tempfile
+import subprocess
+
+ROW_COUNTS = (10000, 50000, 200000)
+MODES = ('list', 'bounded')
+
+
+class DiscardSession:
+    """
+    요청 본문을 읽어 추가한 블록 수만큼 ID를 돌려주는 세션입니다 (응답 외에는 아무것도 보관하지 않음).
+    """
+    class Response:
+        status_code = 200
+
+        def __init__(self, data):
+            self._data = data
+
+        def json(self):
+            return self._data
+
+    def __init__(self):
+        self._next_id = 0
+
+    def request(self, method, url, data=None, **kwargs):
+        if method == 'GET':
+            return self.Response({'id': url.rsplit('/', 1)[-1], 'last_edited_time': '2024-01-02T00:00:00.000Z'})
+        if data is None:
+            body = kwargs['json']
+        else:
+            body = json.loads(data if isinstance(data, (bytes, str)) else b''.join(data))
+        if url.endswith('/children'):
+            return self.Response({'results': [{'id': self._new_id()} for _ in body['children']]})
+        return self.Response({'id': self._new_id(), 'last_edited_time': '2024-01-02T00:00:00.000Z'})
+
+    def _new_id(self):
+        self._next_id += 1
+        return f"bench-{self._next_id}"
+
+
+def run_once(row_count, mode):
+    """
+    main.run_command로 하루치 리포트를 만들고 최대 RSS(KiB), 소요 시간(초), 기록 파일 크기(바이트)를 출력합니다.
+    """
+    from report_registry import ReportDefinition, register
+    from ga_client import GoogleAnalyticsClient
+    from notion_client import NotionClient
+    from loadtest import FakeGAClient
+    import main as app
+
+    register(ReportDefinition(
+        name='all_pages',
+        title='전체 페이지 조회수',
+        dimensions=['pagePath'],
+        metrics=['screenPageViews', 'activeUsers'],
+        metric_labels={'screenPageViews': '조회수', 'activeUsers': '사용자'}
+    ))
+    NotionClient.rate_limiter = None
+
+    with tempfile.TemporaryDirectory() as workdir:
+        journal_path = os.path.join(workdir, 'run_journal.db')
+        render_path = os.path.join(workdir, 'notion_renders.json')
+        argv = ['--sections', 'all_pages', '--journal', journal_path]
+        if mode == 'bounded':
+            argv.append('--memory-bounded')
+        args = app.build_parser().parse_args(argv)
+
+        ga = GoogleAnalyticsClient('bench', client=FakeGAClient(latency=0, rows=row_count),
+                                   sections=args.sections, memory_bounded=args.memory_bounded)
+        notion = NotionClient('bench-token', 'bench-parent', render_store_path=render_path, session=DiscardSession())
+
+        start = time.perf_counter()
+        app.run_command(ga, notion, args, today=datetime.date(2024, 1, 2))
+        elapsed = time.perf_counter() - start
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        stored = os.path.getsize(journal_path) + os.path.getsize(render_path)
+        print(f"{peak} {elapsed:.3f} {stored}")
+
+
+def main():
+    if len(sys.argv) == 3:
+        run_once(int(sys.argv[1]), sys.argv[2])
+        return
+
+    print(f"{'rows':>8} {'mode':<8} {'peak RSS(MiB)':>14} {'time(s)':>8} {'stored(MiB)':>12}")
+    for row_count in ROW_COUNTS:
+        for mode in MODES:
+            output = subprocess.run([sys.executable, __file__, str(row_count), mode],
+                                    check=True, capture_output=True, text=True).stdout.split()
+            peak, elapsed, stored = int(output[-3]), float(output[-2]), int(output[-1])
+            print(f"{row_count:>8} {mode:<8} {peak / 1024:>14.1f} {elapsed:>8.2f} {stored / 1024 / 1024:>12.1f}")
+
+if __name__ == "__main__":
+    main()
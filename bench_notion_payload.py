@@ -0,0 +1,108 @@
+# bench_notion_payload.py
+# 노션 페이지 생성 요청 본문 직렬화 방식 비교 벤치마크
+#
+# requests의 json= 인자(표준 json 모듈로 전체 본문을 한 번에 인코딩)와
+# iter_json_body 인코딩(한 덩어리 본문 / 조각 단위 스트리밍)의 시간 및 최대 추가 메모리를 블록 수별로 비교합니다.
+# NotionClient는 orjson이 있으면 한 덩어리 본문(body/orjson), 없으면 json=을 사용합니다.
+#
+# 실행: python bench_notion_payload.py
+
+import json
+import time
+import tracemalloc
+
+import notion_client
+from notion_client import iter_json_body
+
+BLOCK_COUNTS = (100, 1000, 10000)
+REPEAT = 5
+
+
+def build_payload(block_count):
+    """
+    트래픽 소스 목록과 같은 형태의 블록으로 페이지 생성 요청 데이터를 만듭니다.
+    """
+    children = [
+        {
+            "object": "block",
+            "type": "bulleted_list_item",
+            "bulleted_list_item": {
+                "rich_text": [
+                    {"type": "text", "text": {"content": f"소스 {i}:"}, "annotations": {"bold": True}},
+                    {"type": "text", "text": {"content": f" {i * 7}회 ({i % 100:.1f}%)"}}
+                ]
+            }
+        }
+        for i in range(block_count)
+    ]
+    payload = {
+        "parent": {"page_id": "00000000-0000-0000-0000-000000000000"},
+        "properties": {"title": {"title": [{"text": {"content": "벤치마크 리포트"}}]}},
+        "icon": {"type": "emoji", "emoji": "📊"}
+    }
+    return payload, children
+
+
+def encode_full(payload, children):
+    """
+    requests의 json= 처리와 같은 방식: 전체 dict를 만든 뒤 한 번에 인코딩
+    """
+    body = json.dumps(dict(payload, children=children), allow_nan=False)
+    return len(body.encode('utf-8'))
+
+
+def encode_body(payload, children):
+    """
+    블록 단위로 인코딩한 조각을 이어 붙여 한 번에 전송하는 방식 (NotionClient 기본값)
+    """
+    return len(b''.join(iter_json_body(payload, "children", children)))
+
+
+def encode_streaming(payload, children):
+    """
+    블록 단위로 인코딩한 조각을 전송하는 방식 (조각은 전송 후 버려짐)
+    """
+    return sum(len(chunk) for chunk in iter_json_body(payload, "children", children))
+
+
+def measure(func, payload, children):
+    """
+    최소 실행 시간(초), 최대 추가 메모리(바이트), 본문 크기(바이트)를 측정합니다.
+    """
+    best = float('inf')
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        size = func(payload, children)
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    func(payload, children)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return best, peak, size
+
+
+def main():
+    orjson = notion_client.orjson
+    encoders = [('stdlib', None)]
+    if orjson is not None:
+        encoders.append(('orjson', orjson))
+
+    print(f"{'blocks':>7} {'method':<14} {'time(ms)':>10} {'peak(KiB)':>10} {'body(KiB)':>10}")
+    for block_count in BLOCK_COUNTS:
+        payload, children = build_payload(block_count)
+
+        elapsed, peak, size = measure(encode_full, payload, children)
+        print(f"{block_count:>7} {'json=':<14} {elapsed * 1000:>10.2f} {peak / 1024:>10.1f} {size / 1024:>10.1f}")
+
+        for name, module in encoders:
+            notion_client.orjson = module
+            for label, func in ((f'body/{name}', encode_body), (f'stream/{name}', encode_streaming)):
+                elapsed, peak, size = measure(func, payload, children)
+                print(f"{block_count:>7} {label:<14} {elapsed * 1000:>10.2f} {peak / 1024:>10.1f} {size / 1024:>10.1f}")
+
+    notion_client.orjson = orjson
+
+if __name__ == "__main__":
+    main()
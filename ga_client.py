@@ -2,27 +2,132 @@
 # 구글 애널리틱스 API와 통신하는 모듈
 
 import os
+import heapq
 import datetime
+import threading
+import google.auth
+from google.oauth2 import service_account
 from google.analytics.data_v1beta import BetaAnalyticsDataClient
-from google.analytics.data_v1beta.types import RunReportRequest, DateRange, Metric, Dimension, OrderBy, Filter, FilterExpression
+from google.analytics.data_v1beta.types import RunReportRequest, BatchRunReportsRequest, RunRealtimeReportRequest, DateRange, Metric, Dimension, OrderBy, MetricAggregation
+from report_registry import REPORTS, MAX_REQUESTS_PER_BATCH, plan_requests, decode_rows, select_rows
+from row_table import RowTable
+
+# GA Data API 조회에 필요한 OAuth 범위
+ANALYTICS_SCOPES = ['https://www.googleapis.com/auth/analytics.readonly']
+
+# 프로세스 전체에서 공유하는 자격증명과 GA 클라이언트(gRPC 채널) 풀
+_credentials_cache = {}
+_client_pool = {}
+_pool_lock = threading.Lock()
+
+
+def load_credentials(credentials_file=None):
+    """
+    서비스 계정 키 파일로 자격증명 객체를 만듭니다. 파일이 없으면 기본 자격증명을 사용합니다.
+    같은 파일의 자격증명은 재사용하므로 발급받은 OAuth 토큰도 만료 전까지 인스턴스 간에 공유됩니다.
+    
+    Args:
+        credentials_file (str, optional): 서비스 계정 키 파일 경로
+        
+    Returns:
+        google.auth.credentials.Credentials: 자격증명 객체
+    """
+    cache_key = os.path.abspath(credentials_file) if credentials_file else None
+    
+    with _pool_lock:
+        credentials = _credentials_cache.get(cache_key)
+    if credentials is not None:
+        return credentials
+    
+    # 기본 자격증명 탐색은 메타데이터 서버 확인 등으로 오래 걸릴 수 있어 잠금 밖에서 로드
+    if credentials_file:
+        credentials = service_account.Credentials.from_service_account_file(
+            credentials_file, scopes=ANALYTICS_SCOPES
+        )
+    else:
+        credentials, _ = google.auth.default(scopes=ANALYTICS_SCOPES)
+    
+    # 동시에 로드한 스레드가 있으면 먼저 저장된 자격증명을 사용
+    with _pool_lock:
+        return _credentials_cache.setdefault(cache_key, credentials)
+
+
+def _credentials_key(credentials):
+    """
+    GA 클라이언트 풀의 키를 만듭니다.
+    같은 서비스 계정(가장 대상 포함)과 범위의 자격증명은 객체가 달라도 같은 키가 되어 클라이언트를 공유합니다.
+    사용자 자격증명은 client_id가 여러 계정에 공통(gcloud ADC 등)이라 계정을 구분할 수 없으므로
+    서비스 계정이 아닌 자격증명은 객체 자체를 기준으로 합니다.
+    """
+    account = getattr(credentials, 'service_account_email', None) or getattr(credentials, 'signer_email', None)
+    if not account:
+        return ('object', id(credentials))
+    
+    scopes = getattr(credentials, 'scopes', None) or getattr(credentials, 'default_scopes', None) or ()
+    return (type(credentials).__name__, account, tuple(sorted(scopes)),
+            getattr(credentials, 'quota_project_id', None))
+
+
+def get_shared_client(credentials):
+    """
+    계정과 범위가 같은 자격증명마다 하나씩 만든 GA 클라이언트를 반환합니다.
+    같은 계정을 쓰는 인스턴스는 gRPC 채널을 공유하므로 채널 생성과 인증 과정이 반복되지 않으며,
+    매번 새 자격증명 객체를 넘겨도 클라이언트가 계속 늘어나지 않습니다.
+    
+    Args:
+        credentials (google.auth.credentials.Credentials): 자격증명 객체
+        
+    Returns:
+        BetaAnalyticsDataClient: 공유 GA 클라이언트
+    """
+    key = _credentials_key(credentials)
+    with _pool_lock:
+        entry = _client_pool.get(key)
+        if entry is None:
+            # 풀에 자격증명도 함께 보관해 객체 기준 키의 id가 재사용되지 않도록 함
+            entry = (credentials, BetaAnalyticsDataClient(credentials=credentials))
+            _client_pool[key] = entry
+    
+    return entry[1]
+
 
 class GoogleAnalyticsClient:
-    def __init__(self, property_id, credentials_file=None):
+    # runReport 한 번에 가져올 최대 행 수 (API 상한은 250,000)
+    REPORT_PAGE_SIZE = 10000
+    
+    # 국가/도시 이름 캐시 (모든 인스턴스가 공유)
+    _geo_names = {}
+    
+    def __init__(self, property_id, credentials_file=None, client=None, credentials=None, sections=None,
+                 memory_bounded=False):
         """
         구글 애널리틱스 API 클라이언트 초기화
         
         Args:
             property_id (str): 구글 애널리틱스 속성 ID
             credentials_file (str, optional): 서비스 계정 키 파일 경로
+            client (optional): 사용할 GA Data API 클라이언트 (기록/재생용 클라이언트 등)
+            credentials (optional): 자격증명 객체 (지정하면 credentials_file보다 우선)
+            sections (list, optional): 데일리 데이터에 함께 조회할 분석 섹션 이름 (report_registry.REPORTS)
+            memory_bounded (bool): 행이 많은 분석 섹션을 페이지 단위로 받아 열 단위 배열에 저장할지 여부
         """
         self.property_id = property_id
+        self.sections = list(sections or [])
+        self.memory_bounded = memory_bounded
         
-        # 자격증명 파일 설정
-        if credentials_file:
-            os.environ['GOOGLE_APPLICATION_CREDENTIALS'] = credentials_file
+        if client is not None:
+            self.client = client
+        else:
+            # 환경 변수를 바꾸지 않고 자격증명 객체를 직접 사용하므로
+            # 서로 다른 서비스 계정을 쓰는 클라이언트가 한 프로세스에 공존할 수 있음
+            if credentials is None:
+                credentials = load_credentials(credentials_file)
+            
+            # GA 클라이언트 초기화 (자격증명별 공유 채널)
+            self.client = get_shared_client(credentials)
         
-        # GA 클라이언트 초기화
-        self.client = BetaAnalyticsDataClient()
+        # 지역 분석 결과 캐시 (같은 실행 안에서 반복 조회 방지)
+        self._geo_cache = {}
     
     def get_yesterday_data(self):
         """
@@ -31,10 +136,22 @@ class GoogleAnalyticsClient:
         Returns:
             dict: 어제와 이전 날짜의 GA 데이터를 포함한 딕셔너리
         """
+        yesterday = datetime.datetime.now() - datetime.timedelta(days=1)
+        return self.get_daily_data(yesterday.strftime('%Y-%m-%d'))
+    
+    def get_daily_data(self, date):
+        """
+        지정한 날짜의 주요 GA 데이터와 전날 데이터를 함께 가져옵니다.
+        
+        Args:
+            date (str): 리포트 날짜 (YYYY-MM-DD)
+            
+        Returns:
+            dict: 해당 날짜와 전날의 GA 데이터를 포함한 딕셔너리
+        """
         # 날짜 계산
-        today = datetime.datetime.now()
-        yesterday = today - datetime.timedelta(days=1)
-        day_before_yesterday = today - datetime.timedelta(days=2)
+        yesterday = datetime.datetime.strptime(date, '%Y-%m-%d')
+        day_before_yesterday = yesterday - datetime.timedelta(days=1)
         
         yesterday_str = yesterday.strftime('%Y-%m-%d')
         day_before_yesterday_str = day_before_yesterday.strftime('%Y-%m-%d')
@@ -123,8 +240,110 @@ class GoogleAnalyticsClient:
                 'views': views
             })
         
+        # 추가 분석 섹션 (정의를 묶어 배치로 조회)
+        if self.sections:
+            result['sections'] = self.get_section_data(yesterday_str)
+        
+        return result
+    
+    def get_section_data(self, date):
+        """
+        클라이언트에 설정한 추가 분석 섹션만 조회합니다.
+        메모리 절약 모드의 실행 기록은 섹션을 저장하지 않으므로, 이어서 실행할 때 이 메서드로 다시 조회합니다.
+        
+        Args:
+            date (str): 리포트 날짜 (YYYY-MM-DD)
+            
+        Returns:
+            dict: 섹션 이름별 행 목록 (run_report_definitions 참고)
+        """
+        definitions = [REPORTS[name] for name in self.sections]
+        return self.run_report_definitions(definitions, date, date)
+    
+    def get_daily_metrics(self, start_date, end_date):
+        """
+        기간 내 날짜별 핵심 지표를 한 번의 요청으로 가져옵니다.
+        늦게 집계된 GA 데이터를 리포트에 다시 반영할 때 사용합니다.
+        
+        Args:
+            start_date (str): 시작 날짜 (YYYY-MM-DD)
+            end_date (str): 종료 날짜 (YYYY-MM-DD)
+            
+        Returns:
+            dict: 날짜(YYYY-MM-DD)별 지표 딕셔너리
+        """
+        request = RunReportRequest(
+            property=f'properties/{self.property_id}',
+            date_ranges=[DateRange(start_date=start_date, end_date=end_date)],
+            dimensions=[Dimension(name='date')],
+            metrics=[
+                Metric(name='activeUsers'),
+                Metric(name='screenPageViews'),
+                Metric(name='sessions'),
+                Metric(name='engagementRate'),
+                Metric(name='averageSessionDuration'),
+                Metric(name='bounceRate')
+            ]
+        )
+        
+        response = self.client.run_report(request)
+        
+        result = {}
+        for row in response.rows:
+            # GA는 날짜를 YYYYMMDD 형식으로 반환
+            date = datetime.datetime.strptime(row.dimension_values[0].value, '%Y%m%d').strftime('%Y-%m-%d')
+            result[date] = {
+                'active_users': int(row.metric_values[0].value),
+                'page_views': int(row.metric_values[1].value),
+                'sessions': int(row.metric_values[2].value),
+                'engagement_rate': float(row.metric_values[3].value) * 100,
+                'avg_session_duration': float(row.metric_values[4].value),
+                'bounce_rate': float(row.metric_values[5].value)
+            }
+        
         return result
     
+    def get_realtime_data(self, limit=10):
+        """
+        최근 30분간의 실시간 데이터를 한 번의 요청으로 가져옵니다.
+        화면별 활성 사용자와 함께 전체 합계(TOTAL 집계)를 받습니다.
+        
+        Args:
+            limit (int): 가져올 상위 페이지 수
+            
+        Returns:
+            dict: 활성 사용자, 페이지 조회 수, 상위 페이지 목록
+        """
+        request = RunRealtimeReportRequest(
+            property=f'properties/{self.property_id}',
+            dimensions=[Dimension(name='unifiedScreenName')],
+            metrics=[
+                Metric(name='activeUsers'),
+                Metric(name='screenPageViews')
+            ],
+            metric_aggregations=[MetricAggregation.TOTAL],
+            order_bys=[
+                OrderBy(metric=OrderBy.MetricOrderBy(metric_name="activeUsers"), desc=True)
+            ],
+            limit=limit
+        )
+        
+        response = self.client.run_realtime_report(request)
+        
+        totals = response.totals[0].metric_values if response.totals else None
+        return {
+            'active_users': int(totals[0].value) if totals else 0,
+            'page_views': int(totals[1].value) if totals else 0,
+            'top_pages': [
+                {
+                    'title': row.dimension_values[0].value,
+                    'active_users': int(row.metric_values[0].value),
+                    'views': int(row.metric_values[1].value)
+                }
+                for row in response.rows
+            ]
+        }
+    
     def _get_metrics(self, date):
         """
         기본 지표 데이터를 가져옵니다.
@@ -180,17 +399,7 @@ class GoogleAnalyticsClient:
         """
         디바이스 카테고리별 사용자 통계를 가져옵니다.
         """
-        request = RunReportRequest(
-            property=f'properties/{self.property_id}',
-            date_ranges=[DateRange(start_date=date, end_date=date)],
-            dimensions=[Dimension(name='deviceCategory')],
-            metrics=[
-                Metric(name='activeUsers'),
-                Metric(name='sessions'),
-                Metric(name='engagementRate')
-            ]
-        )
-        
+        request = REPORTS['device_stats'].build_request(self.property_id, date, date)
         return self.client.run_report(request)
     
     def get_content_performance(self, date, limit=10):
@@ -198,21 +407,8 @@ class GoogleAnalyticsClient:
         개별 블로그 포스트 성과를 분석합니다.
         인기 있는 포스트, 체류 시간이 긴 포스트 등을 파악할 수 있습니다.
         """
-        request = RunReportRequest(
-            property=f'properties/{self.property_id}',
-            date_ranges=[DateRange(start_date=date, end_date=date)],
-            dimensions=[Dimension(name='pageTitle'), Dimension(name='pagePath')],
-            metrics=[
-                Metric(name='screenPageViews'),
-                Metric(name='userEngagementDuration'),
-                Metric(name='engagementRate')
-            ],
-            order_bys=[
-                OrderBy(metric=OrderBy.MetricOrderBy(metric_name="screenPageViews"), desc=True)
-            ],
-            limit=limit
-        )
-        
+        request = REPORTS['content_performance'].build_request(self.property_id, date, date)
+        request.limit = limit
         return self.client.run_report(request)
     
     def get_content_engagement(self, date, limit=10):
@@ -220,21 +416,8 @@ class GoogleAnalyticsClient:
         콘텐츠별 체류 시간을 분석합니다.
         어떤 글이 사용자의 관심을 가장 오래 끌었는지 파악할 수 있습니다.
         """
-        request = RunReportRequest(
-            property=f'properties/{self.property_id}',
-            date_ranges=[DateRange(start_date=date, end_date=date)],
-            dimensions=[Dimension(name='pageTitle')],
-            metrics=[
-                Metric(name='userEngagementDuration'),
-                Metric(name='screenPageViews'),
-                Metric(name='engagementRate')
-            ],
-            order_bys=[
-                OrderBy(metric=OrderBy.MetricOrderBy(metric_name="userEngagementDuration"), desc=True)
-            ],
-            limit=limit
-        )
-        
+        request = REPORTS['content_engagement'].build_request(self.property_id, date, date)
+        request.limit = limit
         return self.client.run_report(request)
     
     def get_detailed_traffic_sources(self, date):
@@ -242,44 +425,62 @@ class GoogleAnalyticsClient:
         블로그 트래픽이 어디서 오는지 상세하게 분석합니다.
         검색 엔진, 소셜 미디어, 직접 방문 등의 비율을 파악할 수 있습니다.
         """
-        request = RunReportRequest(
-            property=f'properties/{self.property_id}',
-            date_ranges=[DateRange(start_date=date, end_date=date)],
-            dimensions=[
-                Dimension(name='sessionDefaultChannelGroup'),
-                Dimension(name='sessionSource'),
-                Dimension(name='sessionMedium')
-            ],
-            metrics=[
-                Metric(name='sessions'),
-                Metric(name='activeUsers'),
-                Metric(name='engagementRate')
-            ],
-            order_bys=[
-                OrderBy(metric=OrderBy.MetricOrderBy(metric_name="sessions"), desc=True)
-            ]
-        )
-        
+        request = REPORTS['detailed_traffic_sources'].build_request(self.property_id, date, date)
         return self.client.run_report(request)
     
     def get_new_vs_returning(self, date):
         """
         신규 방문자와 재방문자 비율을 분석합니다.
         """
-        request = RunReportRequest(
-            property=f'properties/{self.property_id}',
-            date_ranges=[DateRange(start_date=date, end_date=date)],
-            dimensions=[Dimension(name='newVsReturningUser')],
-            metrics=[
-                Metric(name='activeUsers'),
-                Metric(name='sessions'),
-                Metric(name='engagementRate'),
-                Metric(name='screenPageViewsPerSession')
-            ]
-        )
-        
+        request = REPORTS['new_vs_returning'].build_request(self.property_id, date, date)
         return self.client.run_report(request)
     
+    def run_report_definitions(self, definitions, start_date, end_date):
+        """
+        여러 분석 섹션 정의를 최소한의 GA 요청으로 묶어 batchRunReports로 실행합니다.
+        
+        메모리 절약 모드에서는 개수 제한이 없는 요청을 페이지 단위로 나누어 받아
+        RowTable(열 단위 배열)에 바로 옮기고 응답은 즉시 해제합니다.
+        
+        Args:
+            definitions (list): ReportDefinition 목록
+            start_date (str): 시작 날짜 (YYYY-MM-DD)
+            end_date (str): 종료 날짜 (YYYY-MM-DD)
+            
+        Returns:
+            dict: 섹션 이름별 행 목록 ({차원/지표 이름: 값} 딕셔너리 목록 또는 RowTable)
+        """
+        plans = plan_requests(definitions)
+        result = {}
+        
+        if self.memory_bounded:
+            paged_plans = [plan for plan in plans if plan.limit is None]
+            plans = [plan for plan in plans if plan.limit is not None]
+            
+            for plan in paged_plans:
+                table = RowTable(plan.dimensions, plan.metrics)
+                for row in self._iter_report_rows(plan.build_request(self.property_id, start_date, end_date)):
+                    table.append_row(row)
+                for definition in plan.definitions:
+                    result[definition.name] = select_rows(definition, table)
+        
+        for start in range(0, len(plans), MAX_REQUESTS_PER_BATCH):
+            batch = plans[start:start + MAX_REQUESTS_PER_BATCH]
+            response = self.client.batch_run_reports(BatchRunReportsRequest(
+                property=f'properties/{self.property_id}',
+                requests=[plan.build_request(self.property_id, start_date, end_date) for plan in batch]
+            ))
+            
+            for plan, report in zip(batch, response.reports):
+                rows = decode_rows(report, plan.dimensions, plan.metrics)
+                for definition in plan.definitions:
+                    result[definition.name] = select_rows(definition, rows)
+            
+            # 디코딩이 끝난 응답은 다음 배치 전에 해제
+            del response
+        
+        return result
+    
     def get_time_patterns(self, start_date, end_date):
         """
         시간대별, 요일별 트래픽 패턴을 분석합니다.
@@ -308,55 +509,127 @@ class GoogleAnalyticsClient:
             'daily': self.client.run_report(daily_request)
         }
     
-    def get_geographic_data(self, date):
+    def get_geographic_data(self, date, top_countries=10, top_cities=10):
         """
         지역별 블로그 사용자를 분석합니다.
         국가 및 도시별 방문자 현황을 파악할 수 있습니다.
+        
+        country + city 리포트 한 번(페이지네이션 포함)으로 모든 행을 받아
+        국가별 합계는 도시 행을 메모리에서 합산해 만들고,
+        국가마다 상위 도시는 크기가 제한된 힙으로 유지합니다.
+        도시 행을 합산한 국가별 활성 사용자는 여러 도시에서 접속한 사용자가
+        중복 집계될 수 있어 GA 국가 리포트 값보다 약간 클 수 있습니다.
+        
+        Args:
+            date (str): 조회 날짜 (YYYY-MM-DD)
+            top_countries (int): 반환할 상위 국가 수
+            top_cities (int): 국가별로 유지할 상위 도시 수
+            
+        Returns:
+            dict: 'countries' (상위 국가 목록)와 'cities' (국가별 상위 도시 목록)
         """
-        # 국가별 분석
-        country_request = RunReportRequest(
+        cache_key = (date, top_countries, top_cities)
+        if cache_key in self._geo_cache:
+            return self._geo_cache[cache_key]
+        
+        request = RunReportRequest(
             property=f'properties/{self.property_id}',
             date_ranges=[DateRange(start_date=date, end_date=date)],
-            dimensions=[Dimension(name='country')],
+            dimensions=[Dimension(name='country'), Dimension(name='city')],
             metrics=[
                 Metric(name='activeUsers'),
                 Metric(name='sessions'),
-                Metric(name='engagementRate')
+                Metric(name='engagedSessions')
             ],
+            # 페이지 사이에서 행 순서가 바뀌지 않도록 차원 기준으로 정렬
             order_bys=[
-                OrderBy(metric=OrderBy.MetricOrderBy(metric_name="activeUsers"), desc=True)
-            ],
-            limit=10
+                OrderBy(dimension=OrderBy.DimensionOrderBy(dimension_name="country")),
+                OrderBy(dimension=OrderBy.DimensionOrderBy(dimension_name="city"))
+            ]
         )
         
-        # 도시별 분석 (한국으로 제한)
-        city_request = RunReportRequest(
-            property=f'properties/{self.property_id}',
-            date_ranges=[DateRange(start_date=date, end_date=date)],
-            dimensions=[Dimension(name='city')],
-            metrics=[
-                Metric(name='activeUsers'),
-                Metric(name='sessions')
-            ],
-            dimension_filter=FilterExpression(
-                filter=Filter(
-                    field_name="country",
-                    string_filter=Filter.StringFilter(
-                        match_type=Filter.StringFilter.MatchType.EXACT,
-                        value="South Korea"
-                    )
-                )
-            ),
-            order_bys=[
-                OrderBy(metric=OrderBy.MetricOrderBy(metric_name="activeUsers"), desc=True)
-            ],
-            limit=10
-        )
+        # 국가별 합계: [활성 사용자, 세션, 참여 세션]
+        country_totals = {}
+        # 국가별 상위 도시 최소 힙: (활성 사용자, 세션, 도시명)
+        city_heaps = {}
+        
+        for row in self._iter_report_rows(request):
+            country = self._intern_geo_name(row.dimension_values[0].value)
+            city = self._intern_geo_name(row.dimension_values[1].value)
+            active_users = int(row.metric_values[0].value)
+            sessions = int(row.metric_values[1].value)
+            engaged_sessions = int(row.metric_values[2].value)
+            
+            totals = country_totals.get(country)
+            if totals is None:
+                totals = country_totals[country] = [0, 0, 0]
+                city_heaps[country] = []
+            totals[0] += active_users
+            totals[1] += sessions
+            totals[2] += engaged_sessions
+            
+            heap = city_heaps[country]
+            entry = (active_users, sessions, city)
+            if len(heap) < top_cities:
+                heapq.heappush(heap, entry)
+            elif entry > heap[0]:
+                heapq.heapreplace(heap, entry)
         
-        return {
-            'country': self.client.run_report(country_request),
-            'city': self.client.run_report(city_request)
+        top = heapq.nlargest(top_countries, country_totals.items(), key=lambda item: (item[1][0], item[1][1]))
+        
+        result = {
+            'countries': [
+                {
+                    'country': country,
+                    'active_users': totals[0],
+                    'sessions': totals[1],
+                    'engagement_rate': (totals[2] / totals[1] * 100) if totals[1] > 0 else 0
+                }
+                for country, totals in top
+            ],
+            'cities': {
+                country: [
+                    {'city': city, 'active_users': active_users, 'sessions': sessions}
+                    for active_users, sessions, city in sorted(heap, reverse=True)
+                ]
+                for country, heap in city_heaps.items()
+            }
         }
+        
+        self._geo_cache[cache_key] = result
+        return result
+    
+    @classmethod
+    def _intern_geo_name(cls, name):
+        """
+        국가/도시 이름은 날짜와 속성이 달라도 거의 바뀌지 않으므로
+        프로세스 전체에서 같은 문자열 객체를 재사용합니다.
+        """
+        return cls._geo_names.setdefault(name, name)
+    
+    def _iter_report_rows(self, request, page_size=None):
+        """
+        offset/limit 페이지네이션으로 리포트의 모든 행을 순회합니다.
+        한 번에 한 페이지의 응답만 메모리에 유지합니다.
+        """
+        page_size = page_size or self.REPORT_PAGE_SIZE
+        offset = 0
+        
+        while True:
+            request.offset = offset
+            request.limit = page_size
+            response = self.client.run_report(request)
+            
+            for row in response.rows:
+                yield row
+            
+            fetched, row_count = len(response.rows), response.row_count
+            # 다음 페이지를 받는 동안 이전 응답이 남지 않도록 바로 해제
+            del response
+            
+            offset += fetched
+            if not fetched or offset >= row_count:
+                break
     
     def get_weekly_trend(self, end_date, days=7):
         """
@@ -390,24 +663,5 @@ class GoogleAnalyticsClient:
         블로그 카테고리별 성과를 분석합니다.
         티스토리 URL 패턴(/category/카테고리명)을 기반으로 합니다.
         """
-        request = RunReportRequest(
-            property=f'properties/{self.property_id}',
-            date_ranges=[DateRange(start_date=date, end_date=date)],
-            dimensions=[Dimension(name='pagePath')],
-            metrics=[
-                Metric(name='screenPageViews'),
-                Metric(name='activeUsers'),
-                Metric(name='engagementRate')
-            ],
-            dimension_filter=FilterExpression(
-                filter=Filter(
-                    field_name="pagePath",
-                    string_filter=Filter.StringFilter(
-                        match_type=Filter.StringFilter.MatchType.CONTAINS,
-                        value="/category/"
-                    )
-                )
-            )
-        )
-        
-        return self.client.run_report(request)
\ No newline at end of file
+        request = REPORTS['category_performance'].build_request(self.property_id, date, date)
+        return self.client.run_report(request)
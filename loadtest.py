@@ -0,0 +1,514 @@
+# loadtest.py
+# 로컬 GA / 노션 대역을 상대로 리포트 파이프라인 처리량을 측정하는 부하 테스트 도구
+#
+# - GA: 지연 시간, 행 수, 할당량 초과(ResourceExhausted) 비율을 설정할 수 있는 가짜 BetaAnalyticsDataClient
+# - 노션: 초당 요청 제한(429 + Retry-After)과 429/5xx 무작위 주입을 지원하는 로컬 HTTP 서버
+#
+# 속성 수 × 날짜 수만큼 main.py 기본 실행과 같은 실행 기록 기반 리포트 생성(run_journaled_report)을
+# 작업자 풀에서 돌리고, 처리량, 작업 지연 시간 p50/p99, 오류율을 출력합니다.
+#
+# 실행: python loadtest.py --properties 10 --days 7 --workers 8 --ga-error-rate 0.02 --notion-error-rate 0.01
+
+import os
+import json
+import time
+import uuid
+import random
+import argparse
+import datetime
+import tempfile
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing import Dict, Any, List, Optional
+
+from google.api_core.exceptions import ResourceExhausted
+from google.analytics.data_v1beta.types import (
+    RunReportResponse, BatchRunReportsResponse, RunRealtimeReportResponse, Row, DimensionValue, MetricValue
+)
+from main import section_names
+
+# 비율/시간 지표는 0~1 사이 실수, 나머지는 정수로 만듦
+_FLOAT_METRIC_SUFFIXES = ('Rate', 'Duration', 'PerSession', 'PerUser')
+
+
+class FakeGAClient:
+    """
+    요청 모양(차원/지표/limit/offset)에 맞는 합성 응답을 돌려주는 BetaAnalyticsDataClient 대역입니다.
+    여러 스레드에서 함께 사용할 수 있습니다.
+    """
+    def __init__(self, latency: float = 0.05, rows: int = 50, error_rate: float = 0.0, seed: Optional[int] = None):
+        """
+        Args:
+            latency (float): 평균 응답 시간(초), 실제 대기는 0.5~1.5배 사이에서 무작위
+            rows (int): 차원이 있는 요청의 전체 행 수
+            error_rate (float): ResourceExhausted(할당량 초과)를 낼 확률
+            seed (int, optional): 난수 시드
+        """
+        self.latency = latency
+        self.rows = rows
+        self.error_rate = error_rate
+        self.stats = Counter()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def run_report(self, request, **kwargs):
+        self._call('run_report')
+        return self._build_response(request)
+
+    def batch_run_reports(self, request, **kwargs):
+        self._call('batch_run_reports')
+        return BatchRunReportsResponse(reports=[self._build_response(item) for item in request.requests])
+
+    def run_realtime_report(self, request, **kwargs):
+        self._call('run_realtime_report')
+        response = self._build_response(request)
+        return RunRealtimeReportResponse(
+            rows=response.rows,
+            totals=[Row(metric_values=[MetricValue(value=str(self.rows * 3)) for _ in request.metrics])],
+            row_count=response.row_count
+        )
+
+    def _call(self, method: str) -> None:
+        """
+        호출 수를 세고, 지연 시간만큼 기다린 뒤 설정한 확률로 할당량 초과 오류를 냅니다.
+        """
+        with self._lock:
+            self.stats[method] += 1
+            delay = self.latency * self._random.uniform(0.5, 1.5)
+            failed = self._random.random() < self.error_rate
+            if failed:
+                self.stats['quota_errors'] += 1
+
+        time.sleep(delay)
+        if failed:
+            raise ResourceExhausted("합성 할당량 초과 (loadtest)")
+
+    def _build_response(self, request) -> RunReportResponse:
+        """
+        요청의 차원/지표 이름으로 행을 만듭니다. 차원이 없으면 합계 한 행을 돌려줍니다.
+        """
+        metrics = [metric.name for metric in request.metrics]
+        dimensions = [dimension.name for dimension in request.dimensions]
+        total = self.rows if dimensions else 1
+
+        offset = getattr(request, 'offset', 0)
+        end = min(offset + request.limit, total) if request.limit else total
+
+        rows = []
+        for i in range(offset, end):
+            rows.append(Row(
+                dimension_values=[DimensionValue(value=f"{name}-{i}") for name in dimensions],
+                metric_values=[MetricValue(value=self._metric_value(name, i)) for name in metrics]
+            ))
+        return RunReportResponse(rows=rows, row_count=total)
+
+    @staticmethod
+    def _metric_value(name: str, index: int) -> str:
+        if name.endswith(_FLOAT_METRIC_SUFFIXES):
+            return f"{1 / (index + 2):.6f}"
+        # 순위가 낮을수록 작아지도록 (정렬 요청과 어긋나지 않게)
+        return str(max(1000 - index * 7, 1))
+
+
+class NotionStandIn:
+    """
+    노션 API 일부(페이지 생성/조회, 블록 추가/조회/수정/삭제, 검색)를 흉내 내는 로컬 HTTP 서버입니다.
+
+    서버 전체에 초당 요청 제한을 두어 넘으면 429와 Retry-After를 돌려주고,
+    설정한 확률로 429와 5xx 응답을 무작위로 섞습니다.
+    """
+    def __init__(self, rate: float = 3.0, burst: int = 3, latency: float = 0.02,
+                 throttle_rate: float = 0.0, error_rate: float = 0.0, retry_after: float = 1.0,
+                 seed: Optional[int] = None):
+        """
+        Args:
+            rate (float): 초당 허용 요청 수 (0이면 제한 없음)
+            burst (int): 한 번에 몰아서 받을 수 있는 최대 요청 수
+            latency (float): 평균 응답 시간(초)
+            throttle_rate (float): 속도 제한과 관계없이 429를 낼 확률
+            error_rate (float): 500/502/503 중 하나를 낼 확률
+            retry_after (float): 429 응답의 Retry-After(초)
+            seed (int, optional): 난수 시드
+        """
+        self.rate = rate
+        self.burst = burst
+        self.latency = latency
+        self.throttle_rate = throttle_rate
+        self.error_rate = error_rate
+        self.retry_after = retry_after
+        self.stats = Counter()
+        self.pages: Dict[str, Dict[str, Any]] = {}
+        self.blocks: Dict[str, Dict[str, Any]] = {}
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._server = None
+        self._thread = None
+
+    @property
+    def api_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def start(self) -> 'NotionStandIn':
+        """
+        임의의 빈 포트에서 서버를 시작합니다.
+        """
+        stand_in = self
+
+        class Handler(_NotionHandler):
+            server_state = stand_in
+
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """
+        서버를 멈춥니다.
+        """
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+
+    def admit(self) -> Optional[int]:
+        """
+        요청을 받을지 정합니다. 거절하면 돌려줄 상태 코드를, 받으면 None을 반환합니다.
+        """
+        with self._lock:
+            self.stats['requests'] += 1
+
+            if self.rate:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens < 1:
+                    self.stats['rate_limited'] += 1
+                    return 429
+                self._tokens -= 1
+
+            if self._random.random() < self.throttle_rate:
+                self.stats['injected_429'] += 1
+                return 429
+            if self._random.random() < self.error_rate:
+                self.stats['injected_5xx'] += 1
+                return self._random.choice((500, 502, 503))
+
+            delay = self.latency * self._random.uniform(0.5, 1.5)
+
+        time.sleep(delay)
+        return None
+
+    def new_block(self, block: Dict[str, Any], parent_id: str) -> Dict[str, Any]:
+        """
+        블록을 저장하고 ID와 시각을 붙인 블록 객체를 돌려줍니다.
+        """
+        block = dict(block, id=str(uuid.uuid4()), object='block', parent={'page_id': parent_id},
+                     last_edited_time=_now())
+        with self._lock:
+            self.blocks[block['id']] = block
+        return block
+
+
+class _NotionHandler(BaseHTTPRequestHandler):
+    """
+    NotionStandIn의 요청 처리기입니다. Transfer-Encoding: chunked 스트리밍 본문도 받습니다.
+    """
+    protocol_version = 'HTTP/1.1'
+    server_state: NotionStandIn = None
+
+    def do_GET(self):
+        self._dispatch('GET')
+
+    def do_POST(self):
+        self._dispatch('POST')
+
+    def do_PATCH(self):
+        self._dispatch('PATCH')
+
+    def do_DELETE(self):
+        self._dispatch('DELETE')
+
+    def log_message(self, format, *args):
+        pass
+
+    def _dispatch(self, method: str) -> None:
+        body = self._read_body()
+        state = self.server_state
+
+        status = state.admit()
+        if status == 429:
+            self._reply(429, {'object': 'error', 'status': 429, 'code': 'rate_limited',
+                              'message': 'Rate limited (loadtest)'},
+                        headers={'Retry-After': f"{state.retry_after:g}"})
+            return
+        if status is not None:
+            self._reply(status, {'object': 'error', 'status': status, 'code': 'internal_server_error',
+                                 'message': 'Injected failure (loadtest)'})
+            return
+
+        path = self.path.split('?')[0].rstrip('/').split('/')[2:]  # '/v1/...' 제외
+        try:
+            status, data = self._route(method, path, json.loads(body) if body else {})
+        except (KeyError, ValueError) as e:
+            status, data = 400, {'object': 'error', 'status': 400, 'code': 'validation_error', 'message': str(e)}
+        self._reply(status, data)
+
+    def _route(self, method: str, path: List[str], body: Dict[str, Any]):
+        state = self.server_state
+
+        if method == 'POST' and path == ['pages']:
+            page_id = str(uuid.uuid4())
+            page = {
+                'object': 'page',
+                'id': page_id,
+                'parent': {'type': 'page_id', 'page_id': body['parent']['page_id']},
+                'properties': body.get('properties', {}),
+                'archived': False,
+                'in_trash': False,
+                'last_edited_time': _now(),
+                'children': [state.new_block(block, page_id)['id'] for block in body.get('children', [])]
+            }
+            with state._lock:
+                state.pages[page_id] = page
+            return 200, _public_page(page)
+
+        if method == 'GET' and len(path) == 2 and path[0] == 'pages':
+            page = state.pages.get(path[1])
+            return (200, _public_page(page)) if page else (404, _not_found(path[1]))
+
+        if method == 'POST' and path == ['search']:
+            return 200, {'object': 'list', 'results': [_public_page(page) for page in list(state.pages.values())],
+                         'has_more': False, 'next_cursor': None}
+
+        if path[:1] == ['blocks'] and len(path) == 3 and path[2] == 'children':
+            page = state.pages.get(path[1])
+            if page is None:
+                return 404, _not_found(path[1])
+            if method == 'GET':
+                results = [state.blocks[block_id] for block_id in page['children']]
+                return 200, {'object': 'list', 'results': results, 'has_more': False, 'next_cursor': None}
+            if method == 'PATCH':
+                blocks = [state.new_block(block, page['id']) for block in body.get('children', [])]
+                with state._lock:
+                    ids = [block['id'] for block in blocks]
+                    after = body.get('after')
+                    position = page['children'].index(after) + 1 if after in page['children'] else len(page['children'])
+                    page['children'][position:position] = ids
+                    page['last_edited_time'] = _now()
+                return 200, {'object': 'list', 'results': blocks}
+
+        if path[:1] == ['blocks'] and len(path) == 2:
+            block = state.blocks.get(path[1])
+            if block is None:
+                return 404, _not_found(path[1])
+            if method == 'PATCH':
+                block.update(body, last_edited_time=_now())
+                return 200, block
+            if method == 'DELETE':
+                with state._lock:
+                    state.blocks.pop(path[1], None)
+                    page = state.pages.get(block['parent']['page_id'])
+                    if page and path[1] in page['children']:
+                        page['children'].remove(path[1])
+                return 200, dict(block, archived=True)
+
+        return 400, {'object': 'error', 'status': 400, 'code': 'invalid_request_url',
+                     'message': f"Unsupported: {method} {self.path}"}
+
+    def _read_body(self) -> bytes:
+        if self.headers.get('Transfer-Encoding', '').lower() == 'chunked':
+            chunks = []
+            while True:
+                size = int(self.rfile.readline().split(b';')[0].strip(), 16)
+                if size == 0:
+                    self.rfile.readline()
+                    break
+                chunks.append(self.rfile.read(size))
+                self.rfile.readline()
+            return b''.join(chunks)
+
+        length = int(self.headers.get('Content-Length') or 0)
+        return self.rfile.read(length) if length else b''
+
+    def _reply(self, status: int, data: Dict[str, Any], headers: Optional[Dict[str, str]] = None) -> None:
+        encoded = json.dumps(data, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(encoded)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(encoded)
+
+
+def _now() -> str:
+    return datetime.datetime.now(datetime.timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3] + 'Z'
+
+
+def _public_page(page: Dict[str, Any]) -> Dict[str, Any]:
+    return {key: value for key, value in page.items() if key != 'children'}
+
+
+def _not_found(object_id: str) -> Dict[str, Any]:
+    return {'object': 'error', 'status': 404, 'code': 'object_not_found', 'message': f"Could not find {object_id}"}
+
+
+def percentile(values: List[float], p: float) -> float:
+    """
+    최근접 순위 방식 백분위수를 계산합니다.
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, int(round(p / 100 * len(ordered) + 0.5)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def run_load(properties: int, days: int, workers: int, ga: FakeGAClient, notion: NotionStandIn,
+             sections: Optional[List[str]] = None, client_rate: Optional[float] = None) -> Dict[str, Any]:
+    """
+    속성 × 날짜 작업을 작업자 풀에서 실행하고 결과 통계를 돌려줍니다.
+
+    Args:
+        properties (int): 가상 GA 속성 수 (속성마다 노션 부모 페이지가 다름)
+        days (int): 속성마다 생성할 최근 날짜 수
+        workers (int): 동시에 실행할 작업 수
+        ga (FakeGAClient): GA 대역
+        notion (NotionStandIn): 시작된 노션 대역
+        sections (list, optional): 리포트에 추가할 분석 섹션 이름
+        client_rate (float, optional): NotionClient 전역 속도 제한(초당 요청 수) 변경값
+
+    Returns:
+        dict: 작업 수, 성공/실패 수, 전체 시간, 작업별 지연 시간, 오류 종류별 수
+    """
+    from ga_client import GoogleAnalyticsClient
+    from notion_client import NotionClient, RateLimiter
+    from run_journal import RunJournal
+    from main import run_journaled_report
+
+    if client_rate is not None:
+        NotionClient.rate_limiter = RateLimiter(rate=client_rate, burst=max(1, int(client_rate))) if client_rate else None
+
+    yesterday = datetime.date.today() - datetime.timedelta(days=1)
+    dates = [(yesterday - datetime.timedelta(days=i)).strftime('%Y-%m-%d') for i in reversed(range(days))]
+
+    pipelines = []
+    for index in range(properties):
+        ga_client = GoogleAnalyticsClient(property_id=f"load-{index}", client=ga, sections=sections)
+        notion_client = NotionClient(token='loadtest', parent_page_id=str(uuid.uuid4()))
+        notion_client.API_URL = notion.api_url
+        pipelines.append((ga_client, notion_client))
+
+    jobs = [(pipeline, date) for pipeline in pipelines for date in dates]
+    latencies, errors = [], Counter()
+    lock = threading.Lock()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        journal = RunJournal(os.path.join(workdir, 'run_journal.db'))
+
+        def run_job(job):
+            (ga_client, notion_client), date = job
+            start = time.perf_counter()
+            try:
+                page_id = run_journaled_report(ga_client, notion_client, journal, date)
+                error = None if page_id else 'notion_failed'
+            except Exception as e:
+                error = type(e).__name__
+            elapsed = time.perf_counter() - start
+            with lock:
+                latencies.append(elapsed)
+                if error:
+                    errors[error] += 1
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(run_job, jobs))
+        wall = time.perf_counter() - start
+        journal.close()
+
+    return {
+        'jobs': len(jobs),
+        'failed': sum(errors.values()),
+        'wall': wall,
+        'latencies': latencies,
+        'errors': errors
+    }
+
+
+def print_report(result: Dict[str, Any], ga: FakeGAClient, notion: NotionStandIn) -> None:
+    """
+    처리량, 지연 시간, 오류율을 출력합니다.
+    """
+    jobs, failed, wall = result['jobs'], result['failed'], result['wall']
+    latencies = result['latencies']
+    ga_calls = sum(count for method, count in ga.stats.items() if method != 'quota_errors')
+    notion_requests = notion.stats['requests']
+    notion_rejected = notion.stats['rate_limited'] + notion.stats['injected_429'] + notion.stats['injected_5xx']
+
+    print(f"작업: {jobs}개 (성공 {jobs - failed}, 실패 {failed}), 전체 {wall:.2f}초")
+    print(f"처리량: {jobs / wall:.2f} 작업/초 ({jobs / wall * 3600:.0f} 작업/시간)")
+    print(f"작업 지연 시간: p50 {percentile(latencies, 50):.3f}초, p99 {percentile(latencies, 99):.3f}초, "
+          f"최대 {max(latencies, default=0):.3f}초")
+    print(f"작업 오류율: {failed / jobs * 100 if jobs else 0:.2f}%"
+          + (f" ({', '.join(f'{name} {count}' for name, count in result['errors'].most_common())})" if failed else ''))
+    print(f"GA 호출: {ga_calls}회, 할당량 초과 {ga.stats['quota_errors']}회 "
+          f"({ga.stats['quota_errors'] / ga_calls * 100 if ga_calls else 0:.2f}%)")
+    print(f"노션 요청: {notion_requests}회, 거절 {notion_rejected}회 "
+          f"({notion_rejected / notion_requests * 100 if notion_requests else 0:.2f}%: "
+          f"속도 제한 {notion.stats['rate_limited']}, 주입 429 {notion.stats['injected_429']}, "
+          f"주입 5xx {notion.stats['injected_5xx']})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 GA/노션 대역으로 리포트 파이프라인 처리량을 측정합니다.")
+    parser.add_argument('--properties', type=int, default=4, help="가상 GA 속성 수 (기본값: 4)")
+    parser.add_argument('--days', type=int, default=3, help="속성마다 생성할 날짜 수 (기본값: 3)")
+    parser.add_argument('--workers', type=int, default=4, help="동시에 실행할 작업 수 (기본값: 4)")
+    parser.add_argument('--sections', type=section_names, help="리포트에 추가할 분석 섹션 (쉼표로 구분)")
+    parser.add_argument('--ga-latency', type=float, default=0.05, help="GA 평균 응답 시간(초) (기본값: 0.05)")
+    parser.add_argument('--ga-rows', type=int, default=50, help="GA 차원 요청의 전체 행 수 (기본값: 50)")
+    parser.add_argument('--ga-error-rate', type=float, default=0.0, help="GA 할당량 초과 확률 (기본값: 0)")
+    parser.add_argument('--notion-rate', type=float, default=3.0, help="노션 대역의 초당 허용 요청 수, 0이면 제한 없음 (기본값: 3)")
+    parser.add_argument('--notion-burst', type=int, default=3, help="노션 대역의 최대 순간 요청 수 (기본값: 3)")
+    parser.add_argument('--notion-latency', type=float, default=0.02, help="노션 평균 응답 시간(초) (기본값: 0.02)")
+    parser.add_argument('--notion-throttle-rate', type=float, default=0.0, help="노션 429 주입 확률 (기본값: 0)")
+    parser.add_argument('--notion-error-rate', type=float, default=0.0, help="노션 5xx 주입 확률 (기본값: 0)")
+    parser.add_argument('--retry-after', type=float, default=1.0, help="429 응답의 Retry-After(초) (기본값: 1)")
+    parser.add_argument('--client-rate', type=float, help="NotionClient 전역 속도 제한 변경 (초당 요청 수, 0이면 제한 없음)")
+    parser.add_argument('--seed', type=int, help="난수 시드")
+    args = parser.parse_args()
+
+    ga = FakeGAClient(latency=args.ga_latency, rows=args.ga_rows, error_rate=args.ga_error_rate, seed=args.seed)
+    notion = NotionStandIn(
+        rate=args.notion_rate,
+        burst=args.notion_burst,
+        latency=args.notion_latency,
+        throttle_rate=args.notion_throttle_rate,
+        error_rate=args.notion_error_rate,
+        retry_after=args.retry_after,
+        seed=args.seed
+    ).start()
+
+    try:
+        result = run_load(
+            args.properties,
+            args.days,
+            args.workers,
+            ga,
+            notion,
+            sections=args.sections,
+            client_rate=args.client_rate
+        )
+    finally:
+        notion.stop()
+
+    print_report(result, ga, notion)
+
+if __name__ == "__main__":
+    main()
@@ -1,45 +1,394 @@
 # 메인 실행 파일
 
 import os
-from config import GA_PROPERTY_ID, GA_CREDENTIALS_FILE, NOTION_TOKEN, NOTION_PARENT_PAGE_ID
+import sys
+import json
+import time
+import argparse
+import datetime
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
 from ga_client import GoogleAnalyticsClient
 from notion_client import NotionClient
+from replay import TrafficArchive, RecordingGAClient, RecordingSession
+from realtime import RealtimePoller
+from report_registry import REPORTS
+from run_journal import RunJournal, STAGE_GA_FETCHED, STAGE_BLOCKS_BUILT, STAGE_PAGE_CREATED, STAGE_BLOCKS_APPENDED
+
+# 생성한 리포트 페이지의 블록 정보와 반영한 GA 데이터를 저장하는 파일
+RENDER_STORE_PATH = "notion_renders.json"
+
+# 파이프라인 단계별 진행 상황을 기록하는 파일 (재실행 시 이어서 진행)
+RUN_JOURNAL_PATH = "run_journal.db"
+
+# 실행 기록과 렌더링 기록을 남겨 둘 기간 (보정 대상 기간보다 넉넉하게)
+STATE_RETENTION_DAYS = 7
+
+# 보정 대상 핵심 지표 (GA는 최대 72시간 동안 데이터를 수정함)
+RECONCILE_FIELDS = ('active_users', 'page_views', 'sessions', 'engagement_rate', 'avg_session_duration', 'bounce_rate')
+
+
+def run_journaled_report(ga_client, notion_client, journal, date):
+    """
+    실행 기록을 남기며 하루치 리포트를 생성합니다.
+    이미 완료된 단계는 기록된 중간 결과를 사용하므로 재실행 시 중단된 단계부터 이어서 진행합니다.
+
+    메모리 절약 모드에서는 분석 섹션과 블록 목록을 기록하지 않습니다 (행 수만큼 커지므로).
+    GA 요약만 기록하고, 이어서 실행할 때 분석 섹션을 다시 조회해 블록을 100개씩 새로 만듭니다.
+
+    Args:
+        ga_client (GoogleAnalyticsClient): GA 클라이언트
+        notion_client (NotionClient): 노션 클라이언트
+        journal (RunJournal): 실행 기록
+        date (str): 리포트 날짜 (YYYY-MM-DD)
+
+    Returns:
+        str or None: 성공 시 노션 페이지 ID, 실패 시 None
+    """
+    property_id = ga_client.property_id
+    memory_bounded = getattr(ga_client, 'memory_bounded', False)
+
+    # 1. GA 데이터 조회
+    ga_data = journal.get(property_id, date, STAGE_GA_FETCHED)
+    if ga_data is None:
+        ga_data = ga_client.get_daily_data(date)
+        summary = {key: value for key, value in ga_data.items() if key != 'sections'}
+        journal.record(property_id, date, STAGE_GA_FETCHED, summary if memory_bounded else ga_data)
+    elif memory_bounded and ga_client.sections:
+        ga_data['sections'] = ga_client.get_section_data(date)
+
+    # 2. 노션 블록 생성 (메모리 절약 모드는 기록 없이 필요한 만큼씩 생성)
+    if memory_bounded:
+        keyed_blocks = notion_client.iter_report_blocks(ga_data)
+    else:
+        keyed_blocks = journal.get(property_id, date, STAGE_BLOCKS_BUILT)
+        if keyed_blocks is None:
+            keyed_blocks = notion_client.build_report_blocks(ga_data)
+            journal.record(property_id, date, STAGE_BLOCKS_BUILT, keyed_blocks)
+    keyed_blocks = iter(keyed_blocks)
+
+    # 3. 노션 페이지 생성 (블록 일부 포함)
+    created = journal.get(property_id, date, STAGE_PAGE_CREATED)
+    if created is None:
+        first_chunk = list(islice(keyed_blocks, notion_client.MAX_CHILDREN_PER_REQUEST))
+        page = notion_client.create_report_page(ga_data, first_chunk)
+        if page is None:
+            return None
+        created = {'page_id': page['id'], 'blocks': len(first_chunk)}
+        journal.record(property_id, date, STAGE_PAGE_CREATED, created)
+        appended = created['blocks']
+    else:
+        appended = journal.get(property_id, date, STAGE_BLOCKS_APPENDED) or created['blocks']
+        # 이전 실행에서 페이지에 들어간 블록은 건너뜀
+        for _ in islice(keyed_blocks, appended):
+            pass
+    page_id = created['page_id']
+
+    # 4. 나머지 블록 추가 (요청 단위로 진행 상황 기록)
+    progress = {'appended': appended}
+
+    def record_progress(count):
+        progress['appended'] += count
+        journal.record(property_id, date, STAGE_BLOCKS_APPENDED, progress['appended'])
+
+    if not notion_client.append_report_blocks(page_id, keyed_blocks, on_chunk=record_progress):
+        return None
+
+    return page_id
+
+
+def run_journaled_reports(ga_client, notion_client, journal, dates, max_workers=4, max_attempts=3, retry_delay=2.0):
+    """
+    여러 날짜의 리포트를 실행 기록과 함께 병렬로 생성합니다.
+    날짜마다 오류를 따로 처리하므로 한 날짜가 실패해도 나머지 날짜는 계속 진행하고,
+    실패한 날짜만 기록된 단계부터 이어서 다시 시도합니다.
+
+    Args:
+        ga_client (GoogleAnalyticsClient): GA 클라이언트
+        notion_client (NotionClient): 노션 클라이언트
+        journal (RunJournal): 실행 기록
+        dates (list): 리포트 날짜 목록 (YYYY-MM-DD)
+        max_workers (int): 동시에 처리할 최대 날짜 수
+        max_attempts (int): 날짜별 최대 시도 횟수
+        retry_delay (float): 재시도 전 기본 대기 시간(초), 재시도마다 두 배로 늘어남
+
+    Returns:
+        dict: 날짜별 노션 페이지 ID (실패 시 None)
+    """
+    page_ids = dict.fromkeys(dates)
+    errors = {}
+
+    def run_one(date):
+        try:
+            page_id = run_journaled_report(ga_client, notion_client, journal, date)
+        except Exception as e:
+            return None, str(e)
+        return page_id, None if page_id else "노션 페이지 생성 또는 블록 추가 실패"
+
+    pending = list(dates)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for attempt in range(1, max_attempts + 1):
+            if not pending:
+                break
+            if attempt > 1:
+                delay = retry_delay * 2 ** (attempt - 2)
+                print(f"실패한 {len(pending)}개 날짜를 {delay:.1f}초 후 다시 생성합니다. ({attempt}/{max_attempts})")
+                time.sleep(delay)
+
+            for date, (page_id, error) in zip(pending, executor.map(run_one, pending)):
+                page_ids[date] = page_id
+                errors[date] = error
+            pending = [date for date in pending if errors[date]]
+
+    for date in pending:
+        print(f"{date} 리포트 생성 실패: {errors[date]} (다시 실행하면 중단된 단계부터 이어서 진행)")
+    succeeded = sum(1 for page_id in page_ids.values() if page_id)
+    print(f"리포트 생성 완료: {succeeded}/{len(dates)}개")
+
+    return page_ids
+
+
+def reconcile_reports(ga_client, notion_client, days=3, threshold=0.01, today=None):
+    """
+    최근 N일 리포트의 핵심 지표를 GA 최신 값으로 다시 맞춥니다.
+
+    날짜 차원 요청 한 번으로 N일(+ 비교용 하루) 지표를 가져오고,
+    저장된 값과 비교해 변화율이 threshold를 넘는 리포트만 바뀐 블록 단위로 갱신합니다.
+
+    Args:
+        ga_client (GoogleAnalyticsClient): GA 클라이언트
+        notion_client (NotionClient): 노션 클라이언트
+        days (int): 다시 확인할 최근 일수
+        threshold (float): 갱신 기준 변화율 (0.01 = 1%)
+        today (datetime.date, optional): 기준 날짜 (기본값: 오늘)
+
+    Returns:
+        list: 갱신한 리포트 날짜 목록
+    """
+    yesterday = (today or datetime.date.today()) - datetime.timedelta(days=1)
+    dates = [(yesterday - datetime.timedelta(days=i)).strftime('%Y-%m-%d') for i in range(days)]
+    prev_day = (yesterday - datetime.timedelta(days=days)).strftime('%Y-%m-%d')
+
+    metrics = ga_client.get_daily_metrics(prev_day, dates[0])
+
+    updated = []
+    for date in dates:
+        if date not in metrics:
+            continue
+
+        snapshot = notion_client.find_report_snapshot(date)
+        if snapshot is None:
+            # 렌더링 기록이 없는 기존 리포트(상태 캐시 유실 등)는 검색으로 찾아 전체 데이터로 다시 채움
+            page_id = notion_client.find_report_page(date)
+            if page_id is not None and notion_client.update_ga_report_page(page_id, ga_client.get_daily_data(date)) is not None:
+                updated.append(date)
+            continue
+        page_id, stored = snapshot
+
+        prev_date = (datetime.datetime.strptime(date, '%Y-%m-%d') - datetime.timedelta(days=1)).strftime('%Y-%m-%d')
+        fresh = dict(stored)
+        for field in RECONCILE_FIELDS:
+            fresh[field] = metrics[date][field]
+            if prev_date in metrics:
+                fresh[f'prev_{field}'] = metrics[prev_date][field]
+
+        if not _has_significant_change(stored, fresh, threshold):
+            continue
+
+        if notion_client.update_ga_report_page(page_id, fresh) is not None:
+            updated.append(date)
+
+    return updated
+
+
+def _has_significant_change(old, new, threshold):
+    """
+    지표 중 하나라도 threshold 이상 변했는지 확인합니다.
+    """
+    for field in RECONCILE_FIELDS:
+        for key in (field, f'prev_{field}'):
+            old_value = old.get(key, 0)
+            if abs(new.get(key, 0) - old_value) > threshold * max(abs(old_value), 1):
+                return True
+    return False
+
+
+def section_names(value):
+    """
+    --sections 인자를 분석 섹션 이름 목록으로 바꿉니다. 등록되지 않은 이름이 있으면 인자 오류로 처리합니다.
+    """
+    names = [name.strip() for name in value.split(',') if name.strip()]
+    unknown = [name for name in names if name not in REPORTS]
+    if unknown:
+        raise argparse.ArgumentTypeError(
+            f"알 수 없는 분석 섹션: {', '.join(unknown)} (사용 가능: {', '.join(REPORTS)})"
+        )
+    return names
+
+
+def build_parser():
+    """
+    명령행 인자 파서를 만듭니다 (replay.py도 기록된 인자를 같은 파서로 해석).
+    """
+    parser = argparse.ArgumentParser(description="GA 데일리 리포트를 노션에 생성합니다.")
+    parser.add_argument('--reconcile', action='store_true', help="최근 리포트를 GA 최신 데이터로 보정")
+    parser.add_argument('--days', type=int, default=3, help="보정할 최근 일수 (기본값: 3)")
+    parser.add_argument('--threshold', type=float, default=0.01, help="보정 기준 변화율 (기본값: 0.01)")
+    parser.add_argument('--backfill', type=int, metavar='DAYS', help="최근 N일 리포트를 병렬로 생성")
+    parser.add_argument('--workers', type=int, default=4, help="백필 시 동시에 처리할 날짜 수 (기본값: 4)")
+    parser.add_argument('--journal', metavar='PATH', default=RUN_JOURNAL_PATH, help="실행 기록 파일 경로")
+    parser.add_argument('--no-journal', action='store_true', help="실행 기록을 파일에 남기지 않음 (이번 실행 안에서만 사용)")
+    parser.add_argument('--keep-days', type=int, default=STATE_RETENTION_DAYS,
+                        help=f"실행 기록과 렌더링 기록을 남겨 둘 최근 일수 (기본값: {STATE_RETENTION_DAYS})")
+    parser.add_argument('--sections', type=section_names,
+                        help=f"리포트에 추가할 분석 섹션 (쉼표로 구분: {', '.join(REPORTS)})")
+    parser.add_argument('--realtime', action='store_true', help="실시간 현황 페이지를 주기적으로 갱신")
+    parser.add_argument('--interval', type=float, default=60, help="실시간 최소 조회 간격(초) (기본값: 60)")
+    parser.add_argument('--max-interval', type=float, default=900, help="실시간 최대 조회 간격(초) (기본값: 900)")
+    parser.add_argument('--record', metavar='PATH', help="GA/노션 통신을 기록할 파일 경로 (replay.py로 재생)")
+    parser.add_argument('--memory-bounded', action='store_true',
+                        help="행 수가 많은 분석 섹션을 열 단위로 저장하고 블록을 100개씩만 생성해 메모리 사용량을 제한")
+    return parser
+
+
+def run_command(ga_client, notion_client, args, today=None):
+    """
+    보정 또는 리포트 생성(데일리/백필)을 실행합니다. 실시간 모드는 main()에서 따로 처리합니다.
+
+    Args:
+        ga_client (GoogleAnalyticsClient): GA 클라이언트
+        notion_client (NotionClient): 노션 클라이언트
+        args (argparse.Namespace): build_parser()로 해석한 인자
+        today (datetime.date, optional): 기준 날짜 (기본값: 오늘, 재생 시에는 기록한 날짜)
+    """
+    today = today or datetime.date.today()
+
+    if args.reconcile:
+        updated = reconcile_reports(ga_client, notion_client, days=args.days, threshold=args.threshold, today=today)
+        if updated:
+            print(f"보정된 리포트: {', '.join(updated)}")
+        else:
+            print("보정이 필요한 리포트가 없습니다.")
+        return
+
+    # 데일리 리포트와 백필 모두 같은 경로로 생성 (--no-journal이면 메모리 안의 실행 기록 사용)
+    yesterday = today - datetime.timedelta(days=1)
+    dates = [(yesterday - datetime.timedelta(days=i)).strftime('%Y-%m-%d')
+             for i in reversed(range(args.backfill or 1))]
+    journal = RunJournal(':memory:' if args.no_journal else args.journal)
+    try:
+        run_journaled_reports(ga_client, notion_client, journal, dates, max_workers=args.workers)
+
+        # 보정 기간이 지난 날짜의 기록은 지워 두 파일이 실행마다 커지지 않게 함 (이번에 만든 날짜는 유지)
+        cutoff = min((today - datetime.timedelta(days=args.keep_days)).strftime('%Y-%m-%d'), dates[0])
+        journal.prune(cutoff)
+        notion_client.prune_renders(cutoff)
+    finally:
+        journal.close()
 
 
 def main():
     """
     구글 애널리틱스 데이터를 노션 페이지에 보고하는 메인 함수
     """
-    
-    
+    parser = build_parser()
+    args = parser.parse_args()
+
+    from config import GA_PROPERTY_ID, GA_CREDENTIALS_FILE, NOTION_TOKEN, NOTION_PARENT_PAGE_ID
+
+    archive = None
+    if args.record:
+        # 재생 시 같은 경로, 같은 날짜, 같은 요청으로 실행할 수 있도록 실행 조건을 함께 기록
+        archive = TrafficArchive(args.record)
+        archive.meta = {
+            'argv': _strip_record_args(sys.argv[1:]),
+            'today': datetime.date.today().isoformat(),
+            'property_id': str(GA_PROPERTY_ID),
+            'parent_page_id': NOTION_PARENT_PAGE_ID,
+            'renders': _load_render_store(RENDER_STORE_PATH),
+            'journal': None if args.no_journal else _load_journal(args.journal)
+        }
+
     try:
         # 구글 애널리틱스 클라이언트 초기화
         ga_client = GoogleAnalyticsClient(
             property_id=GA_PROPERTY_ID,
-            credentials_file=GA_CREDENTIALS_FILE
+            credentials_file=GA_CREDENTIALS_FILE,
+            sections=args.sections,
+            memory_bounded=args.memory_bounded
         )
-        
+        if archive:
+            ga_client.client = RecordingGAClient(ga_client.client, archive)
+
         # 노션 클라이언트 초기화
         notion_client = NotionClient(
             token=NOTION_TOKEN,
-            parent_page_id=NOTION_PARENT_PAGE_ID
+            parent_page_id=NOTION_PARENT_PAGE_ID,
+            render_store_path=RENDER_STORE_PATH,
+            session=RecordingSession(archive) if archive else None
         )
-        
-        # 구글 애널리틱스 데이터 가져오기
-        ga_data = ga_client.get_yesterday_data()
-        
-        # 노션 페이지 생성
-        result = notion_client.create_ga_report_page(ga_data)
-        
-        if result:
-            print("데일리 리포트가 성공적으로 생성되었습니다.")
-            print(f"날짜: {ga_data['date']}")
-            print(f"활성 사용자: {ga_data['active_users']}명")
-        else:
-            print("데일리 리포트 생성 실패")
-            
+
+        if args.realtime:
+            poller = RealtimePoller(
+                ga_client,
+                notion_client,
+                min_interval=args.interval,
+                max_interval=args.max_interval
+            )
+            try:
+                poller.run()
+            except KeyboardInterrupt:
+                print("실시간 갱신을 종료합니다.")
+            return
+
+        run_command(ga_client, notion_client, args)
+
     except Exception as e:
         print(f"오류 발생: {str(e)}")
+    finally:
+        if archive:
+            archive.save()
+            print(f"통신 기록 저장: {args.record} ({len(archive.entries)}건)")
+
+
+def _strip_record_args(argv):
+    """
+    재생할 때 다시 기록하지 않도록 --record 인자를 뺍니다.
+    """
+    stripped = []
+    skip = False
+    for arg in argv:
+        if skip:
+            skip = False
+        elif arg == '--record':
+            skip = True
+        elif not arg.startswith('--record='):
+            stripped.append(arg)
+    return stripped
+
+
+def _load_render_store(path):
+    """
+    렌더링 정보 파일 내용을 그대로 읽습니다 (없으면 None).
+    """
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _load_journal(path):
+    """
+    실행 기록 파일의 내용을 꺼냅니다 (없으면 None).
+    기록한 실행이 이전 단계부터 이어서 진행했어도 재생에서 같은 단계를 건너뛸 수 있게 통신 기록에 함께 저장합니다.
+    """
+    if not os.path.exists(path):
+        return None
+    journal = RunJournal(path)
+    try:
+        return journal.snapshot()
+    finally:
+        journal.close()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -1,57 +1,460 @@
 # notion_client.py
 # 노션 API와 통신하는 모듈
 
+import os
+import json
+import time
+import hashlib
+import threading
 import requests
 import datetime
-from typing import Dict, Any, List, Optional
+import itertools
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Any, List, Optional, Tuple, Iterable, Iterator, Callable
+from report_registry import REPORTS
+from row_table import RowTable
+
+# orjson이 설치되어 있으면 더 빠른 JSON 인코더를 사용
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+
+# 스트리밍 요청 본문을 내보내는 단위 (바이트)
+JSON_CHUNK_SIZE = 64 * 1024
+
+
+def encode_json(obj: Any) -> bytes:
+    """
+    객체를 UTF-8 JSON 바이트로 인코딩합니다.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return _JSON_ENCODER.encode(obj).encode('utf-8')
+
+
+def iter_json_body(payload: Dict[str, Any], stream_key: str, items: Iterable[Any],
+                   chunk_size: int = JSON_CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    payload에 items를 stream_key 배열로 붙인 JSON 본문을 조각 단위로 만들어 냅니다.
+    전체 본문 문자열을 한 번에 만들지 않고 블록 하나씩 인코딩합니다.
+    
+    Args:
+        payload (dict): 배열을 제외한 나머지 요청 데이터
+        stream_key (str): 배열이 들어갈 키 (예: "children")
+        items (iterable): 배열 항목 (제너레이터도 가능)
+        chunk_size (int): 한 번에 내보낼 최소 바이트 수
+        
+    Yields:
+        bytes: JSON 본문 조각
+    """
+    buffer = bytearray(encode_json(payload)[:-1])
+    if payload:
+        buffer += b','
+    buffer += encode_json(stream_key) + b':['
+    
+    for i, item in enumerate(items):
+        if i:
+            buffer += b','
+        buffer += encode_json(item)
+        if len(buffer) >= chunk_size:
+            yield bytes(buffer)
+            buffer.clear()
+    
+    buffer += b']}'
+    yield bytes(buffer)
+
+
+class RateLimiter:
+    """
+    토큰 버킷 방식의 요청 속도 제한기입니다. 여러 스레드에서 함께 사용할 수 있습니다.
+    """
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Args:
+            rate (float): 초당 허용 요청 수
+            burst (int): 한 번에 몰아서 보낼 수 있는 최대 요청 수
+        """
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> None:
+        """
+        요청 하나를 보낼 수 있을 때까지 기다립니다.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            
+            # 토큰을 미리 차감해 두어 대기 중인 다른 스레드가 같은 토큰을 쓰지 않게 함
+            wait = (1 - self._tokens) / self.rate if self._tokens < 1 else 0
+            self._tokens -= 1
+        
+        if wait > 0:
+            time.sleep(wait)
+
 
 class NotionClient:
-    def __init__(self, token: str, parent_page_id: str):
+    API_URL = "https://api.notion.com/v1"
+    
+    # 노션 API 평균 허용량(초당 3회)에 맞춘 프로세스 전역 속도 제한
+    rate_limiter = RateLimiter(rate=3, burst=3)
+    
+    # 429 응답을 받았을 때 다시 시도하는 최대 횟수
+    MAX_RATE_LIMIT_RETRIES = 3
+    
+    # 페이지 생성/블록 추가 요청 한 번에 담을 수 있는 최대 블록 수 (노션 API 제한)
+    MAX_CHILDREN_PER_REQUEST = 100
+    
+    # 블록 배열이 있는 요청 본문을 Transfer-Encoding: chunked로 보낼지 여부
+    # 실제 노션 API에서 확인하지 않았으므로 기본값은 Content-Length가 있는 한 덩어리 본문
+    STREAM_REQUEST_BODIES = False
+    
+    # 메모리 절약 모드(분석 섹션이 RowTable)로 만든 페이지에서 렌더링 기록에 남기는 섹션
+    # 행 수만큼 블록이 생기는 분석 섹션은 기록하지 않고, 보정 대상인 앞쪽 기본 섹션만 부분 갱신합니다.
+    TRACKED_SECTIONS = ('summary', 'sources', 'pages')
+    
+    # 리포트 페이지 제목 형식 (날짜 부분은 '%Y년 %m월 %d일')
+    REPORT_TITLE_PREFIX = "Yeonny's BLOG "
+    REPORT_TITLE_SUFFIX = " 리포트"
+    
+    def __init__(self, token: str, parent_page_id: str, render_store_path: Optional[str] = None,
+                 session: Optional[requests.Session] = None):
         """
         노션 API 클라이언트 초기화
         
         Args:
             token (str): 노션 API 토큰
             parent_page_id (str): 부모 페이지 ID
+            render_store_path (str, optional): 생성한 블록 정보를 저장할 JSON 파일 경로
+            session (requests.Session, optional): HTTP 세션 (기록/재생용 세션 등)
         """
         self.token = token
         self.parent_page_id = parent_page_id
+        self.session = session if session is not None else requests.Session()
         self.headers = {
             "Authorization": f"Bearer {token}",
             "Content-Type": "application/json",
             "Notion-Version": "2022-06-28"
         }
+        
+        # 페이지별로 마지막으로 렌더링한 블록 (키, 블록 ID, 내용 해시) 목록과 페이지 메타데이터
+        # (날짜, 부모 페이지, last_edited_time). 실행 간에 유지되어 페이지/블록 조회 요청을 대신함
+        self.render_store_path = render_store_path
+        self._renders = self._load_renders()
+        self._render_lock = threading.RLock()
+        # (부모 페이지, 날짜) → 페이지 ID 색인 (부모 페이지마다 같은 날짜의 리포트가 따로 있을 수 있음)
+        self._date_index = {
+            self._index_key(render.get('parent_page_id'), render['date']): page_id
+            for page_id, render in self._renders.items() if render.get('date')
+        }
+        
+        # 이번 실행에서 이미 확인했거나 직접 만든 페이지 (다시 확인하지 않음)
+        self._validated = set()
+        self._searched = False
+    
+    def _request(self, method: str, path: str, json_body: Optional[Tuple[Dict[str, Any], str, List[Any]]] = None,
+                 **kwargs) -> requests.Response:
+        """
+        노션 API를 호출합니다.
+        전역 속도 제한을 지키고, 429 응답은 Retry-After만큼 기다린 뒤 다시 시도합니다.
+        
+        Args:
+            method (str): HTTP 메서드
+            path (str): API 경로 (예: "/pages")
+            json_body (tuple, optional): (배열을 제외한 요청 데이터, 배열 키, 배열 항목)
+                orjson이 있으면 블록 단위로 인코딩하고(STREAM_REQUEST_BODIES이면 조각 단위로 전송),
+                없으면 requests의 json= 인코딩을 그대로 사용합니다.
+        """
+        stream = False
+        if json_body is not None:
+            payload, stream_key, items = json_body
+            if orjson is None:
+                kwargs['json'] = dict(payload, **{stream_key: items})
+            elif self.STREAM_REQUEST_BODIES:
+                stream = True
+            else:
+                kwargs['data'] = b''.join(iter_json_body(payload, stream_key, items))
+        
+        for attempt in range(self.MAX_RATE_LIMIT_RETRIES + 1):
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            
+            if stream:
+                # 스트리밍 본문은 한 번만 읽을 수 있으므로 재시도마다 새로 만듦
+                kwargs['data'] = iter_json_body(payload, stream_key, items)
+            response = self.session.request(method, f"{self.API_URL}{path}", headers=self.headers, **kwargs)
+            
+            if response.status_code != 429 or attempt == self.MAX_RATE_LIMIT_RETRIES:
+                return response
+            
+            retry_after = float(response.headers.get('Retry-After', 1))
+            print(f"노션 API 요청 제한, {retry_after:.1f}초 후 다시 시도합니다.")
+            time.sleep(retry_after)
     
-    def create_ga_report_page(self, ga_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    def publish_many(self, ga_data_list: List[Dict[str, Any]], parent_page_ids: Optional[List[str]] = None,
+                     max_workers: int = 4, max_attempts: int = 3, retry_delay: float = 2.0) -> List[Dict[str, Any]]:
+        """
+        여러 GA 데이터(백필, 여러 부모 페이지 발행 등)를 작업자 풀에서 병렬로 발행합니다.
+        HTTP 세션과 전역 속도 제한을 함께 사용하며, 실패한 항목만 다시 시도합니다.
+        
+        Args:
+            ga_data_list (list): 구글 애널리틱스 데이터 목록
+            parent_page_ids (list, optional): 각 데이터를 발행할 부모 페이지 ID 목록 (기본값: 기본 부모 페이지)
+            max_workers (int): 동시에 발행할 최대 작업 수
+            max_attempts (int): 항목별 최대 시도 횟수
+            retry_delay (float): 재시도 전 기본 대기 시간(초), 재시도마다 두 배로 늘어남
+            
+        Returns:
+            list: 항목별 결과 ('date', 'parent_page_id', 'page', 'attempts', 'error')
+                  페이지는 만들었지만 블록 추가가 끝나지 않았으면 'page'와 'error'가 함께 채워집니다.
+        """
+        parent_page_ids = parent_page_ids or [self.parent_page_id]
+        targets = [(ga_data, parent_page_id) for ga_data in ga_data_list for parent_page_id in parent_page_ids]
+        results = [
+            {'date': ga_data['date'], 'parent_page_id': parent_page_id, 'page': None, 'attempts': 0, 'error': None}
+            for ga_data, parent_page_id in targets
+        ]
+        
+        pending = list(range(len(targets)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for attempt in range(1, max_attempts + 1):
+                if not pending:
+                    break
+                if attempt > 1:
+                    delay = retry_delay * 2 ** (attempt - 2)
+                    print(f"실패한 {len(pending)}개 항목을 {delay:.1f}초 후 다시 발행합니다. ({attempt}/{max_attempts})")
+                    time.sleep(delay)
+                
+                # 이전 시도에서 페이지를 이미 만들었으면 새로 만들지 않고 남은 블록만 이어서 추가
+                futures = {
+                    executor.submit(self._publish_report, *targets[i], results[i]['page']): i
+                    for i in pending
+                }
+                
+                failed = []
+                for future in as_completed(futures):
+                    i = futures[future]
+                    results[i]['attempts'] = attempt
+                    try:
+                        page, complete = future.result()
+                        if page is None:
+                            error = "노션 페이지 생성 실패"
+                        else:
+                            error = None if complete else "노션 블록 추가 실패"
+                    except Exception as e:
+                        page = results[i]['page']
+                        error = str(e)
+                    
+                    results[i]['page'] = page or results[i]['page']
+                    results[i]['error'] = error
+                    if error:
+                        failed.append(i)
+                
+                pending = sorted(failed)
+        
+        return results
+    
+    def create_ga_report_page(self, ga_data: Dict[str, Any],
+                              parent_page_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """
         GA 데이터를 포함한 노션 페이지를 생성합니다.
         
         Args:
             ga_data (dict): 구글 애널리틱스 데이터
+            parent_page_id (str, optional): 부모 페이지 ID (기본값: 클라이언트의 부모 페이지)
+            
+        Returns:
+            dict or None: 성공 시 응답 데이터, 실패 시 None
+        """
+        page, complete = self._publish_report(ga_data, parent_page_id)
+        return page if complete else None
+    
+    def _publish_report(self, ga_data: Dict[str, Any], parent_page_id: Optional[str] = None,
+                        page: Optional[Dict[str, Any]] = None) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """
+        리포트 페이지를 만들고 나머지 블록을 추가합니다.
+        page를 넘기면 새로 만들지 않고, 그 페이지에 이미 들어간 블록 다음부터 이어서 추가합니다.
+        
+        Returns:
+            tuple: (페이지 응답 또는 None, 모든 블록 추가 완료 여부)
+        """
+        # 노션 페이지 콘텐츠 구성 (핵심 지표, 트래픽 소스, 인기 페이지)
+        # 블록은 요청 단위(100개)만큼만 만들어 보내고 버리므로 전체 블록 목록을 메모리에 두지 않음
+        keyed_blocks = self.iter_report_blocks(ga_data)
+        
+        if page is None:
+            first_chunk = list(itertools.islice(keyed_blocks, self.MAX_CHILDREN_PER_REQUEST))
+            page = self.create_report_page(ga_data, first_chunk, parent_page_id)
+            if page is None:
+                return None, False
+        else:
+            # 이전 시도에서 페이지에 들어간 블록은 건너뜀
+            for _ in itertools.islice(keyed_blocks, self._renders[page['id']]['block_count']):
+                pass
+        
+        # 페이지 생성 요청에 담지 못한 나머지 블록 추가
+        # 연결 오류로 중단돼도 만든 페이지를 돌려주어 재시도 때 같은 날짜 페이지를 또 만들지 않게 함
+        try:
+            return page, self.append_report_blocks(page['id'], keyed_blocks)
+        except requests.RequestException as e:
+            print(f"노션 블록 추가 중 오류: {e}")
+            return page, False
+    
+    def append_report_blocks(self, page_id: str, keyed_blocks: Iterable[Tuple[str, Dict[str, Any]]],
+                             on_chunk: Optional[Callable[[int], None]] = None) -> bool:
+        """
+        리포트 블록을 요청 단위(100개)로 만들어 페이지 끝에 추가하고 렌더링 기록에 덧붙입니다.
+        블록은 제너레이터에서 필요한 만큼만 꺼내므로 전체 블록 목록을 메모리에 두지 않습니다.
+        
+        Args:
+            page_id (str): 노션 페이지 ID
+            keyed_blocks (iterable): 추가할 (키, 블록) (페이지에 이미 들어간 블록 다음부터)
+            on_chunk (callable, optional): 요청 하나가 성공할 때마다 추가한 블록 수로 호출 (진행 기록용)
+            
+        Returns:
+            bool: 모두 추가했으면 True
+        """
+        keyed_blocks = iter(keyed_blocks)
+        complete = True
+        appended = False
+        try:
+            while True:
+                chunk = list(itertools.islice(keyed_blocks, self.MAX_CHILDREN_PER_REQUEST))
+                if not chunk:
+                    break
+                if self.append_blocks(page_id, [block for _, block in chunk]) is None:
+                    complete = False
+                    break
+                self._extend_render(page_id, chunk)
+                appended = True
+                if on_chunk is not None:
+                    on_chunk(len(chunk))
+        finally:
+            # 요청 중 예외가 나도 이미 추가한 블록은 기록해 두어야 이어서 추가할 수 있음
+            if appended:
+                self._touch_page(page_id)
+            self._save_renders()
+        return complete
+    
+    def create_report_page(self, ga_data: Dict[str, Any], keyed_blocks: List[Tuple[str, Dict[str, Any]]],
+                           parent_page_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        리포트 페이지를 만들고 블록을 요청 한 번에 담을 수 있는 만큼(최대 100개) 넣습니다.
+        나머지 블록은 append_blocks로 추가해야 합니다.
+        
+        Args:
+            ga_data (dict): 구글 애널리틱스 데이터
+            keyed_blocks (list): build_report_blocks로 만든 (키, 블록) 목록
+            parent_page_id (str, optional): 부모 페이지 ID (기본값: 클라이언트의 부모 페이지)
             
         Returns:
             dict or None: 성공 시 응답 데이터, 실패 시 None
         """
         # 페이지 제목 설정
-        date_obj = datetime.datetime.strptime(ga_data['date'], '%Y-%m-%d')
-        formatted_date = date_obj.strftime('%Y년 %m월 %d일')
-        page_title = f"Yeonny's BLOG {formatted_date} 리포트"
+        page_title = self._report_title(ga_data['date'])
         
-        # 노션 페이지 콘텐츠 구성
-        children = self._build_page_content(ga_data)
+        page = self._create_page(page_title, "📊", keyed_blocks, parent_page_id)
+        if page is not None:
+            # 이후 부분 업데이트를 위해 렌더링 결과 기록 (블록 ID는 필요할 때 조회)
+            self._remember_render(page, keyed_blocks, date=ga_data['date'], ga_data=ga_data,
+                                  parent_page_id=parent_page_id)
+        return page
+    
+    def create_live_page(self, keyed_blocks: List[Tuple[str, Dict[str, Any]]]) -> Optional[Dict[str, Any]]:
+        """
+        실시간 현황 페이지를 만듭니다. 이후에는 sync_page_blocks로 바뀐 블록만 갱신합니다.
         
-        # 트래픽 소스 섹션 추가
-        traffic_source_blocks = self._build_traffic_source_section(ga_data)
-        children.extend(traffic_source_blocks)
+        Args:
+            keyed_blocks (list): build_realtime_blocks로 만든 (키, 블록) 목록
+            
+        Returns:
+            dict or None: 성공 시 응답 데이터, 실패 시 None
+        """
+        page = self._create_page("Yeonny's BLOG 실시간 현황", "⚡", keyed_blocks)
+        if page is not None:
+            self._remember_render(page, keyed_blocks)
+            with self._render_lock:
+                self._renders[page['id']]['live'] = True
+                self._save_renders()
+        return page
+    
+    def prune_renders(self, before: str) -> int:
+        """
+        기준 날짜보다 이전 리포트 페이지의 렌더링 기록을 지웁니다 (노션 페이지는 그대로 둠).
+        지운 페이지가 다시 필요하면 find_report_page의 검색으로 찾아 처음 동기화할 때 다시 만듭니다.
         
-        # 인기 페이지 섹션 추가
-        popular_pages_blocks = self._build_popular_pages_section(ga_data)
-        children.extend(popular_pages_blocks)
+        Args:
+            before (str): 이 날짜(YYYY-MM-DD)보다 이전 리포트의 기록을 삭제
+            
+        Returns:
+            int: 삭제한 페이지 기록 수
+        """
+        with self._render_lock:
+            expired = [
+                page_id for page_id, render in self._renders.items()
+                if render.get('date') and render['date'] < before
+            ]
+            for page_id in expired:
+                self._unindex_date(page_id, self._renders.pop(page_id))
+            if expired:
+                self._save_renders()
+        return len(expired)
+    
+    def find_live_page(self) -> Optional[str]:
+        """
+        이전에 만든 실시간 현황 페이지 ID를 찾습니다.
         
-        # 노션 API 요청 데이터
+        Returns:
+            str or None: 페이지 ID, 기록이 없으면 None
+        """
+        for page_id, render in list(self._renders.items()):
+            if render.get('live') and self._revalidate_page(page_id):
+                return page_id
+        return None
+    
+    def find_report_page(self, date: str, parent_page_id: Optional[str] = None) -> Optional[str]:
+        """
+        해당 날짜 리포트 페이지 ID를 찾습니다.
+        
+        저장된 메타데이터가 있으면 페이지 조회 한 번으로 유효한지만 확인하고,
+        없으면 노션 검색으로 리포트 페이지를 부모 페이지별로 한 번에 모아 저장합니다
+        (검색은 실행당 한 번만 하므로 이후 조회는 요청 없이 처리됩니다).
+        
+        Args:
+            date (str): 리포트 날짜 (YYYY-MM-DD)
+            parent_page_id (str, optional): 부모 페이지 ID (기본값: 클라이언트의 부모 페이지)
+            
+        Returns:
+            str or None: 페이지 ID, 찾지 못하면 None
+        """
+        index_key = self._index_key(parent_page_id, date)
+        page_id = self._date_index.get(index_key)
+        if page_id is not None and self._revalidate_page(page_id):
+            return page_id
+        
+        if not self._searched:
+            self._index_report_pages()
+            return self._date_index.get(index_key)
+        return None
+    
+    def _create_page(self, page_title: str, emoji: str, keyed_blocks: List[Tuple[str, Dict[str, Any]]],
+                     parent_page_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        제목과 블록(최대 100개)으로 노션 페이지를 생성합니다.
+        """
+        children = [block for _, block in keyed_blocks[:self.MAX_CHILDREN_PER_REQUEST]]
+        
+        # 노션 API 요청 데이터 (children은 요청 본문을 만들 때 블록 단위로 붙임)
         data = {
             "parent": {
-                "page_id": self.parent_page_id
+                "page_id": parent_page_id or self.parent_page_id
             },
             "properties": {
                 "title": {
@@ -66,13 +469,12 @@ class NotionClient:
             },
             "icon": {
             "type": "emoji",
-            "emoji": "📊"
-            },
-            "children": children
+            "emoji": emoji
+            }
         }
         
         # 노션 API 호출하여 페이지 생성
-        response = requests.post('https://api.notion.com/v1/pages', headers=self.headers, json=data)
+        response = self._request('POST', '/pages', json_body=(data, "children", children))
         
         if response.status_code == 200:
             print(f"성공적으로 노션 페이지를 생성했습니다: {page_title}")
@@ -82,6 +484,719 @@ class NotionClient:
             print(f"에러 메시지: {response.text}")
             return None
     
+    def update_ga_report_page(self, page_id: str, ga_data: Dict[str, Any]) -> Optional[Dict[str, int]]:
+        """
+        이미 생성한 리포트 페이지를 새 GA 데이터로 갱신합니다.
+        값이 바뀐 블록만 PATCH 하므로 GA의 늦은 데이터 보정을 적은 요청으로 반영할 수 있습니다.
+        
+        Args:
+            page_id (str): 갱신할 노션 페이지 ID
+            ga_data (dict): 구글 애널리틱스 데이터
+            
+        Returns:
+            dict or None: 성공 시 변경된 블록 수 ('updated', 'inserted', 'deleted'), 실패 시 None
+        """
+        render = self._renders.get(page_id)
+        if (render and render.get('partial')) or self._is_memory_bounded(ga_data):
+            # 메모리 절약 모드 페이지는 기록해 둔 기본 섹션만 갱신 (분석 섹션 블록은 그대로 둠)
+            ga_data = self._summary_data(ga_data)
+        
+        keyed_blocks = self.build_report_blocks(ga_data)
+        counts = self.sync_page_blocks(page_id, keyed_blocks, date=ga_data['date'])
+        
+        if counts is not None:
+            with self._render_lock:
+                self._renders[page_id]['ga_data'] = ga_data
+                self._save_renders()
+        return counts
+    
+    def find_report_snapshot(self, date: str,
+                             parent_page_id: Optional[str] = None) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """
+        해당 날짜 리포트의 페이지 ID와 마지막으로 반영한 GA 데이터를 찾습니다.
+        
+        Args:
+            date (str): 리포트 날짜 (YYYY-MM-DD)
+            parent_page_id (str, optional): 부모 페이지 ID (기본값: 클라이언트의 부모 페이지)
+            
+        Returns:
+            tuple or None: (페이지 ID, GA 데이터), 기록이 없으면 None
+        """
+        page_id = self._date_index.get(self._index_key(parent_page_id, date))
+        if page_id is None or not self._renders[page_id].get('ga_data'):
+            return None
+        if not self._revalidate_page(page_id):
+            return None
+        return page_id, self._renders[page_id]['ga_data']
+    
+    def sync_page_blocks(self, page_id: str, keyed_blocks: List[Tuple[str, Dict[str, Any]]],
+                         date: Optional[str] = None) -> Optional[Dict[str, int]]:
+        """
+        페이지의 블록을 새로 만든 블록 목록과 비교해 달라진 부분만 반영합니다.
+        
+        - 내용이 바뀐 블록: PATCH /v1/blocks/{id}
+        - 새로 생긴 블록: 직전 블록 뒤에 추가 (연속된 블록은 한 번에)
+        - 사라진 블록: DELETE /v1/blocks/{id}
+        
+        Args:
+            page_id (str): 노션 페이지 ID
+            keyed_blocks (list): (키, 블록) 목록
+            date (str, optional): 리포트 날짜
+            
+        Returns:
+            dict or None: 성공 시 변경된 블록 수, 실패 시 None
+        """
+        render = self._renders.get(page_id)
+        if render is None or not self._resolve_block_ids(page_id, render):
+            # 이전 렌더링 정보를 쓸 수 없으면 페이지 내용을 다시 만든다
+            return self._rebuild_page_blocks(page_id, keyed_blocks, date)
+        
+        old_entries = {key: (block_id, digest) for key, block_id, digest in render['blocks']}
+        new_keys = {key for key, _ in keyed_blocks}
+        counts = {'updated': 0, 'inserted': 0, 'deleted': 0}
+        entries = []
+        pending = []  # 아직 추가되지 않은 연속된 새 블록
+        deleted = set()
+        prev_block_id = None
+        
+        def save_progress():
+            # 중간에 실패해도 이미 반영한 블록(추가/수정/삭제)은 기록해 두어야
+            # 다음 동기화에서 같은 블록을 다시 추가하지 않는다.
+            # 아직 처리하지 못한 기존 블록은 이전 내용 그대로 남아 있으므로 이전 기록을 유지
+            done = {key for key, _, _ in entries} | deleted
+            render['blocks'] = entries + [
+                [key, block_id, digest] for key, (block_id, digest) in old_entries.items() if key not in done
+            ]
+            if any(counts.values()):
+                self._touch_page(page_id)
+            self._save_renders()
+        
+        def flush_pending():
+            nonlocal prev_block_id
+            if not pending:
+                return True
+            if prev_block_id is None:
+                return False
+            block_ids = self.append_blocks(page_id, [block for _, block, _ in pending], after=prev_block_id)
+            if block_ids is None:
+                return False
+            for (key, _, digest), block_id in zip(pending, block_ids):
+                entries.append([key, block_id, digest])
+            counts['inserted'] += len(pending)
+            prev_block_id = block_ids[-1]
+            pending.clear()
+            return True
+        
+        try:
+            for key, block in keyed_blocks:
+                digest = self._block_digest(block)
+                if key not in old_entries:
+                    pending.append((key, block, digest))
+                    continue
+            
+                if not flush_pending():
+                    return self._rebuild_page_blocks(page_id, keyed_blocks, date)
+            
+                block_id, old_digest = old_entries[key]
+                if digest != old_digest:
+                    block_type = block['type']
+                    response = self._request('PATCH', f'/blocks/{block_id}', json={block_type: block[block_type]})
+                    if response.status_code != 200:
+                        print(f"노션 블록 업데이트 실패: {response.status_code}")
+                        print(f"에러 메시지: {response.text}")
+                        save_progress()
+                        return None
+                    counts['updated'] += 1
+                entries.append([key, block_id, digest])
+                prev_block_id = block_id
+        
+            if not flush_pending():
+                return self._rebuild_page_blocks(page_id, keyed_blocks, date)
+        
+            for key, (block_id, _) in old_entries.items():
+                if key in new_keys:
+                    continue
+                response = self._request('DELETE', f'/blocks/{block_id}')
+                if response.status_code != 200:
+                    print(f"노션 블록 삭제 실패: {response.status_code}")
+                    print(f"에러 메시지: {response.text}")
+                    save_progress()
+                    return None
+                deleted.add(key)
+                counts['deleted'] += 1
+        
+        except requests.RequestException:
+            # 연결 오류/시간 초과로 중단돼도 이미 반영한 블록은 기록해 둔다
+            save_progress()
+            raise
+        
+        if date:
+            self._index_date(page_id, date)
+        save_progress()
+        
+        print(f"노션 페이지 부분 업데이트 완료: 수정 {counts['updated']}개, 추가 {counts['inserted']}개, 삭제 {counts['deleted']}개")
+        return counts
+    
+    def _rebuild_page_blocks(self, page_id: str, keyed_blocks: List[Tuple[str, Dict[str, Any]]],
+                             date: Optional[str] = None) -> Optional[Dict[str, int]]:
+        """
+        페이지의 기존 블록을 모두 지우고 새 블록으로 다시 채웁니다.
+        저장된 렌더링 정보가 없거나 페이지가 수동으로 편집된 경우에 사용합니다.
+        """
+        if self._renders.get(page_id, {}).get('partial'):
+            # 분석 섹션 블록은 기록이 없어 다시 만들 수 없으므로 페이지를 지우지 않음
+            print(f"메모리 절약 모드로 만든 페이지는 전체 재구성을 할 수 없습니다: {page_id}")
+            return None
+        
+        existing = self._list_child_blocks(page_id)
+        if existing is None:
+            return None
+        
+        for block in existing:
+            response = self._request('DELETE', f"/blocks/{block['id']}")
+            if response.status_code != 200:
+                print(f"노션 블록 삭제 실패: {response.status_code}")
+                print(f"에러 메시지: {response.text}")
+                return None
+        
+        block_ids = self.append_blocks(page_id, [block for _, block in keyed_blocks])
+        if block_ids is None:
+            return None
+        
+        # 페이지 메타데이터(실시간 페이지 여부, 부모 페이지 등)는 유지
+        render = self._renders.setdefault(page_id, {'date': None, 'ga_data': None})
+        render['blocks'] = [
+            [key, block_id, self._block_digest(block)]
+            for (key, block), block_id in zip(keyed_blocks, block_ids)
+        ]
+        render['block_count'] = len(block_ids)
+        if date:
+            self._index_date(page_id, date)
+        self._touch_page(page_id)
+        self._save_renders()
+        
+        print(f"노션 페이지 전체 재구성 완료: {len(block_ids)}개 블록")
+        return {'updated': 0, 'inserted': len(block_ids), 'deleted': len(existing)}
+    
+    def append_blocks(self, page_id: str, blocks: List[Dict[str, Any]],
+                      after: Optional[str] = None) -> Optional[List[str]]:
+        """
+        페이지에 블록을 추가하고 새 블록 ID 목록을 반환합니다.
+        요청 한 번에 최대 100개씩 나누어 보냅니다.
+        
+        Args:
+            page_id (str): 노션 페이지 ID
+            blocks (list): 추가할 노션 블록 목록
+            after (str, optional): 이 블록 뒤에 추가 (기본값: 페이지 끝)
+            
+        Returns:
+            list or None: 성공 시 새 블록 ID 목록, 실패 시 None
+        """
+        block_ids = []
+        
+        for start in range(0, len(blocks), self.MAX_CHILDREN_PER_REQUEST):
+            chunk = blocks[start:start + self.MAX_CHILDREN_PER_REQUEST]
+            data = {"after": after} if after else {}
+            
+            response = self._request('PATCH', f'/blocks/{page_id}/children',
+                                     json_body=(data, "children", chunk))
+            if response.status_code != 200:
+                print(f"노션 블록 추가 실패: {response.status_code}")
+                print(f"에러 메시지: {response.text}")
+                return None
+            
+            chunk_ids = [block['id'] for block in response.json()['results']]
+            block_ids.extend(chunk_ids)
+            if after:
+                after = chunk_ids[-1]
+        
+        return block_ids
+    
+    def _list_child_blocks(self, page_id: str, limit: Optional[int] = None) -> Optional[List[Dict[str, Any]]]:
+        """
+        페이지의 하위 블록을 순서대로 가져옵니다 (limit이 있으면 앞에서부터 그만큼 이상 모이면 중단).
+        """
+        blocks = []
+        params = {"page_size": 100}
+        
+        while True:
+            response = self._request('GET', f'/blocks/{page_id}/children', params=params)
+            if response.status_code != 200:
+                print(f"노션 블록 조회 실패: {response.status_code}")
+                print(f"에러 메시지: {response.text}")
+                return None
+            
+            body = response.json()
+            blocks.extend(body['results'])
+            if not body.get('has_more') or (limit is not None and len(blocks) >= limit):
+                return blocks
+            params['start_cursor'] = body['next_cursor']
+    
+    def _resolve_block_ids(self, page_id: str, render: Dict[str, Any]) -> bool:
+        """
+        블록 ID가 비어 있으면 페이지의 하위 블록을 한 번 조회해 채웁니다.
+        블록 수가 기록과 다르면 (수동 편집 등) False를 반환합니다.
+        메모리 절약 모드 페이지는 기록한 앞쪽 블록 수만큼만 조회합니다.
+        """
+        if all(block_id for _, block_id, _ in render['blocks']):
+            return True
+        
+        if render.get('partial'):
+            existing = self._list_child_blocks(page_id, limit=len(render['blocks']))
+            if existing is None or len(existing) < len(render['blocks']):
+                return False
+            existing = existing[:len(render['blocks'])]
+        else:
+            existing = self._list_child_blocks(page_id)
+            if existing is None or len(existing) != len(render['blocks']):
+                return False
+        
+        for entry, block in zip(render['blocks'], existing):
+            entry[1] = block['id']
+        self._save_renders()
+        return True
+    
+    def _remember_render(self, page: Dict[str, Any], keyed_blocks: List[Tuple[str, Dict[str, Any]]],
+                         date: Optional[str] = None, ga_data: Optional[Dict[str, Any]] = None,
+                         parent_page_id: Optional[str] = None) -> None:
+        """
+        새로 만든 페이지의 블록 키와 내용 해시, 반영한 GA 데이터와 페이지 메타데이터를 기록합니다.
+        메모리 절약 모드 데이터는 기본 섹션의 블록과 분석 섹션을 뺀 GA 데이터만 기록합니다 (partial).
+        """
+        partial = ga_data is not None and self._is_memory_bounded(ga_data)
+        render = {
+            'date': None,
+            'ga_data': self._summary_data(ga_data) if partial else ga_data,
+            'blocks': [
+                [key, None, self._block_digest(block)]
+                for key, block in keyed_blocks if not partial or self._is_tracked(key)
+            ],
+            'block_count': len(keyed_blocks),
+            'parent_page_id': parent_page_id or self.parent_page_id,
+            'last_edited_time': page.get('last_edited_time')
+        }
+        if partial:
+            render['partial'] = True
+        with self._render_lock:
+            self._renders[page['id']] = render
+            self._validated.add(page['id'])
+            if date:
+                self._index_date(page['id'], date)
+            self._save_renders()
+    
+    def _revalidate_page(self, page_id: str, force: bool = False) -> bool:
+        """
+        저장된 페이지 메타데이터가 아직 유효한지 페이지 조회(GET /v1/pages/{id}) 한 번으로 확인합니다.
+        
+        - 삭제(보관/휴지통)되었거나 다른 부모 페이지로 옮겨졌으면 기록을 지우고 False
+        - last_edited_time이 기록과 다르면 (다른 사람이 편집) 블록 ID를 비워 다음 동기화 때 다시 조회
+        - 일시적인 오류로 확인하지 못하면 저장된 기록을 그대로 사용
+        
+        실행마다 페이지당 한 번만 확인합니다 (force이면 이미 확인한 페이지도 다시 확인).
+        """
+        if page_id in self._validated and not force:
+            return True
+        
+        response = self._request('GET', f'/pages/{page_id}')
+        if response.status_code == 404:
+            self._invalidate_page(page_id)
+            return False
+        if response.status_code != 200:
+            print(f"노션 페이지 확인 실패: {response.status_code}")
+            print(f"에러 메시지: {response.text}")
+            return True
+        
+        page = response.json()
+        with self._render_lock:
+            render = self._renders.get(page_id)
+            if render is None:
+                return False
+            
+            # 부모 페이지를 기록하기 전에 만든 페이지는 현재 부모를 기준으로 삼음
+            current_parent = page.get('parent', {}).get('page_id')
+            if not render.get('parent_page_id') and current_parent:
+                self._unindex_date(page_id, render)
+                render['parent_page_id'] = current_parent
+                if render.get('date'):
+                    self._index_date(page_id, render['date'])
+            parent_page_id = render.get('parent_page_id')
+            moved = parent_page_id and not self._same_id(current_parent, parent_page_id)
+            if page.get('archived') or page.get('in_trash') or moved:
+                self._invalidate_page(page_id)
+                return False
+            
+            last_edited_time = page.get('last_edited_time')
+            cached_time = render.get('last_edited_time')
+            if cached_time and cached_time != last_edited_time:
+                for entry in render['blocks']:
+                    entry[1] = None
+            render['last_edited_time'] = last_edited_time
+            self._validated.add(page_id)
+            self._save_renders()
+        return True
+    
+    def _index_report_pages(self) -> None:
+        """
+        노션 검색(POST /v1/search)으로 부모 페이지 아래의 리포트 페이지를 모두 찾아 메타데이터에 추가합니다.
+        저장된 기록이 없을 때(첫 실행, 캐시 유실 등)만 사용하며, 찾은 페이지는 블록 정보가 없으므로
+        처음 동기화할 때 페이지 내용을 다시 만듭니다.
+        """
+        data = {
+            "query": self.REPORT_TITLE_PREFIX.strip(),
+            "filter": {"property": "object", "value": "page"},
+            "page_size": 100
+        }
+        
+        while True:
+            response = self._request('POST', '/search', json=data)
+            if response.status_code != 200:
+                print(f"노션 페이지 검색 실패: {response.status_code}")
+                print(f"에러 메시지: {response.text}")
+                return
+            
+            body = response.json()
+            for page in body['results']:
+                self._index_search_result(page)
+            
+            if not body.get('has_more'):
+                break
+            data['start_cursor'] = body['next_cursor']
+        
+        with self._render_lock:
+            self._searched = True
+            self._save_renders()
+    
+    def _index_search_result(self, page: Dict[str, Any]) -> None:
+        """
+        검색 결과 페이지가 리포트 페이지이면 날짜를 읽어 메타데이터에 추가합니다.
+        다른 부모 페이지(다른 속성 등) 아래의 리포트도 그 부모 페이지 기준으로 색인합니다.
+        """
+        if page.get('archived') or page.get('in_trash'):
+            return
+        parent_page_id = page.get('parent', {}).get('page_id')
+        if not parent_page_id:
+            return
+        
+        title = ''.join(
+            text.get('plain_text', '')
+            for prop in page.get('properties', {}).values() if prop.get('type') == 'title'
+            for text in prop['title']
+        )
+        if not (title.startswith(self.REPORT_TITLE_PREFIX) and title.endswith(self.REPORT_TITLE_SUFFIX)):
+            return
+        try:
+            date_text = title[len(self.REPORT_TITLE_PREFIX):-len(self.REPORT_TITLE_SUFFIX)]
+            date = datetime.datetime.strptime(date_text, '%Y년 %m월 %d일').strftime('%Y-%m-%d')
+        except ValueError:
+            return
+        
+        with self._render_lock:
+            if self._index_key(parent_page_id, date) in self._date_index:
+                return
+            self._renders[page['id']] = {
+                'date': None,
+                'ga_data': None,
+                'blocks': [],
+                'parent_page_id': parent_page_id,
+                'last_edited_time': page.get('last_edited_time')
+            }
+            self._validated.add(page['id'])
+            self._index_date(page['id'], date)
+    
+    def _index_date(self, page_id: str, date: str) -> None:
+        """
+        페이지의 리포트 날짜를 기록하고 (부모 페이지, 날짜) → 페이지 ID 색인을 갱신합니다.
+        """
+        with self._render_lock:
+            render = self._renders[page_id]
+            render['date'] = date
+            self._date_index[self._index_key(render.get('parent_page_id'), date)] = page_id
+    
+    def _unindex_date(self, page_id: str, render: Dict[str, Any]) -> None:
+        """
+        색인이 아직 이 페이지를 가리키면 (부모 페이지, 날짜) 항목을 지웁니다.
+        """
+        if not render.get('date'):
+            return
+        index_key = self._index_key(render.get('parent_page_id'), render['date'])
+        if self._date_index.get(index_key) == page_id:
+            del self._date_index[index_key]
+    
+    def _index_key(self, parent_page_id: Optional[str], date: str) -> Tuple[str, str]:
+        """
+        날짜 색인의 키 (하이픈/대소문자를 정규화한 부모 페이지 ID, 날짜)를 만듭니다.
+        """
+        parent_page_id = parent_page_id or self.parent_page_id
+        return parent_page_id.replace('-', '').lower(), date
+    
+    def _touch_page(self, page_id: str) -> None:
+        """
+        직접 수정한 페이지를 한 번 다시 조회해 수정 후의 last_edited_time을 기록합니다.
+        다음 실행의 확인에서 이 값과 다르면 그 뒤에 다른 사람이 편집한 것으로 봅니다.
+        조회에 실패하면 값을 비워, 다음 확인에서 받은 값을 새 기준으로 삼습니다.
+        (노션의 last_edited_time은 분 단위이므로 같은 분 안에 일어난 다른 편집은 구분하지 못합니다.)
+        """
+        try:
+            response = self._request('GET', f'/pages/{page_id}')
+            last_edited_time = response.json().get('last_edited_time') if response.status_code == 200 else None
+        except requests.RequestException:
+            last_edited_time = None
+        with self._render_lock:
+            render = self._renders.get(page_id)
+            if render is not None:
+                render['last_edited_time'] = last_edited_time
+    
+    def _invalidate_page(self, page_id: str) -> None:
+        """
+        삭제되었거나 옮겨진 페이지의 기록을 지웁니다.
+        """
+        with self._render_lock:
+            render = self._renders.pop(page_id, None)
+            if render:
+                self._unindex_date(page_id, render)
+            self._save_renders()
+        print(f"노션 페이지가 삭제되었거나 옮겨져 기록을 지웠습니다: {page_id}")
+    
+    @staticmethod
+    def _same_id(a: Optional[str], b: Optional[str]) -> bool:
+        """
+        하이픈 유무와 관계없이 노션 ID가 같은지 비교합니다.
+        """
+        return bool(a and b) and a.replace('-', '').lower() == b.replace('-', '').lower()
+    
+    def _report_title(self, date: str) -> str:
+        """
+        리포트 날짜(YYYY-MM-DD)로 페이지 제목을 만듭니다.
+        """
+        formatted_date = datetime.datetime.strptime(date, '%Y-%m-%d').strftime('%Y년 %m월 %d일')
+        return f"{self.REPORT_TITLE_PREFIX}{formatted_date}{self.REPORT_TITLE_SUFFIX}"
+    
+    def _extend_render(self, page_id: str, keyed_blocks: List[Tuple[str, Dict[str, Any]]]) -> None:
+        """
+        페이지 뒤에 추가한 블록의 키와 내용 해시를 렌더링 기록에 덧붙입니다 (파일 저장은 호출한 쪽에서).
+        """
+        with self._render_lock:
+            render = self._renders.get(page_id)
+            if render is None:
+                return
+            render['block_count'] = render.get('block_count', len(render['blocks'])) + len(keyed_blocks)
+            render['blocks'].extend(
+                [key, None, self._block_digest(block)]
+                for key, block in keyed_blocks if not render.get('partial') or self._is_tracked(key)
+            )
+    
+    def _is_tracked(self, key: str) -> bool:
+        """
+        메모리 절약 모드 페이지에서 렌더링 기록에 남기는 블록인지 확인합니다.
+        """
+        return key.split(':', 1)[0] in self.TRACKED_SECTIONS
+    
+    @staticmethod
+    def _is_memory_bounded(ga_data: Dict[str, Any]) -> bool:
+        """
+        메모리 절약 모드로 조회한(분석 섹션이 RowTable인) GA 데이터인지 확인합니다.
+        """
+        return any(isinstance(rows, RowTable) for rows in ga_data.get('sections', {}).values())
+    
+    @staticmethod
+    def _summary_data(ga_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        분석 섹션을 뺀 GA 데이터 (핵심 지표, 트래픽 소스, 인기 페이지)를 돌려줍니다.
+        """
+        return {key: value for key, value in ga_data.items() if key != 'sections'}
+    
+    def _load_renders(self) -> Dict[str, Any]:
+        """
+        저장된 렌더링 정보를 불러옵니다.
+        """
+        if not self.render_store_path or not os.path.exists(self.render_store_path):
+            return {}
+        
+        with open(self.render_store_path, 'r', encoding='utf-8') as f:
+            return json.load(f).get('pages', {})
+    
+    def _save_renders(self) -> None:
+        """
+        렌더링 정보를 파일에 저장합니다.
+        """
+        if not self.render_store_path:
+            return
+        
+        with self._render_lock:
+            tmp_path = f"{self.render_store_path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'pages': self._renders}, f, ensure_ascii=False)
+            os.replace(tmp_path, self.render_store_path)
+    
+    def build_report_blocks(self, ga_data: Dict[str, Any]) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        리포트 페이지의 전체 블록을 만들고 블록마다 고정된 키를 붙입니다.
+        
+        Args:
+            ga_data (dict): 구글 애널리틱스 데이터
+            
+        Returns:
+            list: (키, 노션 블록) 목록
+        """
+        return list(self.iter_report_blocks(ga_data))
+    
+    def iter_report_blocks(self, ga_data: Dict[str, Any]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        build_report_blocks와 같은 (키, 블록)을 필요할 때 하나씩 만들어 돌려줍니다.
+        추가 분석 섹션은 행을 순회하면서 블록을 만들므로 행 수가 많아도 블록 목록이 한꺼번에 생기지 않습니다.
+        
+        Args:
+            ga_data (dict): 구글 애널리틱스 데이터
+            
+        Yields:
+            tuple: (키, 노션 블록)
+        """
+        sections = [
+            ('summary', self._build_page_content(ga_data)),
+            ('sources', self._build_traffic_source_section(ga_data)),
+            ('pages', self._build_popular_pages_section(ga_data))
+        ]
+        
+        # 추가 분석 섹션은 레지스트리 등록 순서대로 각 정의의 렌더러로 구성
+        section_rows = ga_data.get('sections', {})
+        for name, definition in REPORTS.items():
+            if name in section_rows:
+                sections.append((name, definition.render(section_rows[name])))
+        
+        return self._iter_keyed_blocks(sections)
+    
+    @staticmethod
+    def _assign_block_keys(sections: List[Tuple[str, Iterable[Dict[str, Any]]]]) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        섹션별 블록에 키를 붙입니다.
+        """
+        return list(NotionClient._iter_keyed_blocks(sections))
+    
+    @staticmethod
+    def _iter_keyed_blocks(sections: List[Tuple[str, Iterable[Dict[str, Any]]]]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        섹션별 블록에 키를 붙여 하나씩 돌려줍니다.
+        지표 줄은 굵은 글씨 라벨("방문자: " 등)로, 나머지는 섹션 안에서의 타입별 순번으로 구분합니다.
+        목록 항목은 순위 기준이라 순서가 바뀌어도 같은 블록의 내용만 수정됩니다.
+        """
+        for section, blocks in sections:
+            counters = {}
+            for block in blocks:
+                block_type = block['type']
+                rich_text = block[block_type].get('rich_text', [])
+                if block_type == 'paragraph' and rich_text and rich_text[0].get('annotations', {}).get('bold'):
+                    key = f"{section}:{rich_text[0]['text']['content']}"
+                else:
+                    index = counters.get(block_type, 0)
+                    counters[block_type] = index + 1
+                    key = f"{section}:{block_type}:{index}"
+                yield key, block
+    
+    @staticmethod
+    def _block_digest(block: Dict[str, Any]) -> str:
+        """
+        블록 내용 비교용 해시를 계산합니다.
+        """
+        encoded = json.dumps(block, sort_keys=True, ensure_ascii=False).encode('utf-8')
+        return hashlib.sha1(encoded).hexdigest()
+    
+    def build_realtime_blocks(self, realtime_data: Dict[str, Any]) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        실시간 현황 페이지 블록을 만들고 블록마다 고정된 키를 붙입니다.
+        
+        Args:
+            realtime_data (dict): GoogleAnalyticsClient.get_realtime_data 결과와
+                마지막으로 값이 바뀐 시각('updated_at')
+            
+        Returns:
+            list: (키, 노션 블록) 목록
+        """
+        def metric_line(label, value):
+            return {
+                "object": "block",
+                "type": "paragraph",
+                "paragraph": {
+                    "rich_text": [
+                        {
+                            "type": "text",
+                            "text": {
+                                "content": label
+                            },
+                            "annotations": {
+                                "bold": True
+                            }
+                        },
+                        {
+                            "type": "text",
+                            "text": {
+                                "content": value
+                            }
+                        }
+                    ]
+                }
+            }
+        
+        blocks = [
+            {
+                "object": "block",
+                "type": "heading_3",
+                "heading_3": {
+                    "rich_text": [
+                        {
+                            "type": "text",
+                            "text": {
+                                "content": "[ 최근 30분 현황 ]"
+                            }
+                        }
+                    ]
+                }
+            },
+            metric_line("활성 사용자: ", f"{realtime_data['active_users']}명"),
+            metric_line("페이지 조회: ", f"{realtime_data['page_views']}회"),
+            metric_line("마지막 변화: ", realtime_data.get('updated_at', '-')),
+            {
+                "object": "block",
+                "type": "heading_3",
+                "heading_3": {
+                    "rich_text": [
+                        {
+                            "type": "text",
+                            "text": {
+                                "content": "[ 지금 많이 보는 페이지 ]"
+                            }
+                        }
+                    ]
+                }
+            }
+        ]
+        
+        for page in realtime_data['top_pages']:
+            blocks.append({
+                "object": "block",
+                "type": "numbered_list_item",
+                "numbered_list_item": {
+                    "rich_text": [
+                        {
+                            "type": "text",
+                            "text": {
+                                "content": f"{page['active_users']}명 |"
+                            },
+                            "annotations": {
+                                "bold": True
+                            }
+                        },
+                        {
+                            "type": "text",
+                            "text": {
+                                "content": f" {page['title']}"
+                            }
+                        }
+                    ]
+                }
+            })
+        
+        return self._assign_block_keys([('live', blocks)])
+    
     def _build_page_content(self, ga_data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
         노션 페이지의 핵심 지표 섹션을 구성합니다.
@@ -489,10 +1604,7 @@ class NotionClient:
         """
         try:
             # 간단한 API 호출로 토큰 유효성 검사
-            response = requests.get(
-                'https://api.notion.com/v1/users/me',
-                headers=self.headers
-            )
+            response = self._request('GET', '/users/me')
             
             if response.status_code == 200:
                 user_data = response.json()
@@ -0,0 +1,106 @@
+# realtime.py
+# GA 실시간 데이터를 주기적으로 조회해 노션 실시간 현황 페이지를 갱신하는 모듈
+
+import time
+import datetime
+from typing import Dict, Any, Optional
+
+
+class RealtimePoller:
+    """
+    GA Realtime API를 주기적으로 조회해 노션 실시간 현황 페이지 하나를 제자리에서 갱신합니다.
+
+    조회 간격은 적응형입니다. 값이 그대로면 간격을 backoff배씩 늘리고(최대 max_interval),
+    의미 있는 변화가 생기면 min_interval로 되돌립니다.
+    노션에는 값이 바뀐 블록만 PATCH 하므로 GA와 노션 요청 수가 모두 낮게 유지됩니다.
+    """
+    def __init__(self, ga_client, notion_client, min_interval: float = 60, max_interval: float = 900,
+                 backoff: float = 2.0, change_threshold: float = 0.05, page_id: Optional[str] = None):
+        """
+        Args:
+            ga_client (GoogleAnalyticsClient): GA 클라이언트
+            notion_client (NotionClient): 노션 클라이언트
+            min_interval (float): 최소 조회 간격(초), 변화가 생기면 이 간격으로 돌아감
+            max_interval (float): 최대 조회 간격(초)
+            backoff (float): 변화가 없을 때 간격에 곱할 배율
+            change_threshold (float): 변화로 볼 활성 사용자/조회 수 변화율 (0.05 = 5%)
+            page_id (str, optional): 갱신할 노션 페이지 ID (기본값: 이전에 만든 실시간 페이지)
+        """
+        self.ga_client = ga_client
+        self.notion_client = notion_client
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.change_threshold = change_threshold
+        self.page_id = page_id or notion_client.find_live_page()
+        self.interval = min_interval
+        self._last_data = None
+
+    def poll_once(self) -> bool:
+        """
+        실시간 데이터를 한 번 조회하고, 의미 있는 변화가 있으면 노션 페이지를 갱신합니다.
+
+        Returns:
+            bool: 변화가 있었으면 True
+        """
+        data = self.ga_client.get_realtime_data()
+        changed = self._last_data is None or self._has_changed(self._last_data, data)
+
+        if changed:
+            data['updated_at'] = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            keyed_blocks = self.notion_client.build_realtime_blocks(data)
+
+            if self.page_id is None:
+                page = self.notion_client.create_live_page(keyed_blocks)
+                if page is None:
+                    return False
+                self.page_id = page['id']
+            elif self.notion_client.sync_page_blocks(self.page_id, keyed_blocks) is None:
+                # 실행 중에 페이지가 삭제(보관)되었으면 다음 조회에서 새로 만듦
+                if not self.notion_client._revalidate_page(self.page_id, force=True):
+                    print(f"실시간 현황 페이지가 삭제되어 새로 만듭니다: {self.page_id}")
+                    self.page_id = None
+                    self._last_data = None
+                return False
+
+            self._last_data = data
+            self.interval = self.min_interval
+        else:
+            self.interval = min(self.interval * self.backoff, self.max_interval)
+
+        return changed
+
+    def run(self, max_polls: Optional[int] = None) -> None:
+        """
+        조회를 반복합니다. Ctrl+C로 멈출 수 있습니다.
+
+        Args:
+            max_polls (int, optional): 최대 조회 횟수 (기본값: 무제한)
+        """
+        polls = 0
+        while max_polls is None or polls < max_polls:
+            try:
+                changed = self.poll_once()
+            except Exception as e:
+                # 일시적인 오류는 다음 조회에서 다시 시도
+                print(f"실시간 조회 중 오류 발생: {str(e)}")
+                changed = False
+                self.interval = min(self.interval * self.backoff, self.max_interval)
+
+            polls += 1
+            print(f"실시간 조회 {polls}회: {'변화 감지' if changed else '변화 없음'}, 다음 조회까지 {self.interval:.0f}초")
+
+            if max_polls is None or polls < max_polls:
+                time.sleep(self.interval)
+
+    def _has_changed(self, old: Dict[str, Any], new: Dict[str, Any]) -> bool:
+        """
+        합계 지표가 change_threshold 이상 변했거나 상위 페이지 순위가 바뀌었는지 확인합니다.
+        """
+        for key in ('active_users', 'page_views'):
+            if abs(new[key] - old[key]) > self.change_threshold * max(old[key], 1):
+                return True
+
+        old_titles = [page['title'] for page in old['top_pages']]
+        new_titles = [page['title'] for page in new['top_pages']]
+        return old_titles != new_titles
@@ -0,0 +1,419 @@
+# replay.py
+# GA / 노션 API 통신을 기록하고 네트워크 없이 재생하는 모듈
+
+import gzip
+import json
+import time
+import base64
+import hashlib
+import argparse
+import threading
+from collections import defaultdict
+from typing import Dict, Any, List, Optional
+
+import requests
+from google.analytics.data_v1beta import types
+
+
+class TrafficArchive:
+    """
+    GA 요청/응답과 노션 HTTP 통신을 담는 기록 파일입니다.
+    gzip으로 압축한 JSON Lines 형식이며, GA 메시지는 protobuf 바이너리를 base64로 저장합니다.
+    노션 요청 헤더(토큰)는 기록하지 않습니다.
+    """
+    VERSION = 1
+
+    def __init__(self, path: str, entries: Optional[List[Dict[str, Any]]] = None,
+                 meta: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            path (str): 기록 파일 경로 (.jsonl.gz)
+            entries (list, optional): 이미 불러온 기록 목록
+            meta (dict, optional): 기록한 실행 조건 (명령행 인자, 기준 날짜, GA 속성 ID, 부모 페이지 ID,
+                                   기록 시작 시점의 렌더링 정보)
+        """
+        self.path = path
+        self.entries = entries if entries is not None else []
+        self.meta = meta or {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path: str) -> 'TrafficArchive':
+        """
+        기록 파일을 불러옵니다.
+        """
+        entries = []
+        meta = {}
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            for line in f:
+                entry = json.loads(line)
+                if entry.get('kind') == 'meta':
+                    meta = entry.get('run', {})
+                else:
+                    entries.append(entry)
+        return cls(path, entries, meta)
+
+    def add(self, entry: Dict[str, Any]) -> None:
+        """
+        통신 기록 하나를 추가합니다.
+        """
+        with self._lock:
+            self.entries.append(entry)
+
+    def save(self) -> None:
+        """
+        기록을 파일에 저장합니다.
+        """
+        with self._lock:
+            with gzip.open(self.path, 'wt', encoding='utf-8') as f:
+                f.write(json.dumps({'kind': 'meta', 'version': self.VERSION, 'run': self.meta}, ensure_ascii=False) + '\n')
+                for entry in self.entries:
+                    f.write(json.dumps(entry, ensure_ascii=False, separators=(',', ':')) + '\n')
+
+
+def _encode_message(message) -> Dict[str, str]:
+    """
+    GA protobuf 메시지를 타입 이름과 base64 바이너리로 변환합니다.
+    """
+    message_type = type(message)
+    return {
+        'type': message_type.__name__,
+        'data': base64.b64encode(message_type.serialize(message)).decode('ascii')
+    }
+
+
+def _decode_message(encoded: Dict[str, str]):
+    """
+    _encode_message로 저장한 GA 메시지를 복원합니다.
+    """
+    message_type = getattr(types, encoded['type'])
+    return message_type.deserialize(base64.b64decode(encoded['data']))
+
+
+def _request_key(request) -> str:
+    """
+    GA 요청 내용으로 재생 시 응답을 찾을 키를 만듭니다.
+    """
+    encoded = json.dumps(type(request).to_dict(request), sort_keys=True)
+    return hashlib.sha1(encoded.encode('utf-8')).hexdigest()
+
+
+class RecordingGAClient:
+    """
+    BetaAnalyticsDataClient를 감싸 모든 요청/응답을 기록합니다.
+    """
+    def __init__(self, client, archive: TrafficArchive):
+        """
+        Args:
+            client: 실제 GA Data API 클라이언트
+            archive (TrafficArchive): 기록을 저장할 아카이브
+        """
+        self.client = client
+        self.archive = archive
+
+    def run_report(self, request, **kwargs):
+        return self._call('run_report', request, **kwargs)
+
+    def batch_run_reports(self, request, **kwargs):
+        return self._call('batch_run_reports', request, **kwargs)
+
+    def run_realtime_report(self, request, **kwargs):
+        return self._call('run_realtime_report', request, **kwargs)
+
+    def _call(self, method: str, request, **kwargs):
+        start = time.perf_counter()
+        response = getattr(self.client, method)(request, **kwargs)
+        elapsed = time.perf_counter() - start
+
+        self.archive.add({
+            'kind': 'ga',
+            'method': method,
+            'key': _request_key(request),
+            'request': _encode_message(request),
+            'response': _encode_message(response),
+            'elapsed': elapsed
+        })
+        return response
+
+
+class ReplayGAClient:
+    """
+    기록된 GA 응답을 재생하는 BetaAnalyticsDataClient 대용 클라이언트입니다.
+
+    요청 내용이 같은 기록을 우선 사용하고, 날짜가 달라지는 등 일치하는 기록이 없으면
+    같은 메서드의 기록을 순서대로 사용합니다. 기록을 모두 쓰면 처음부터 반복합니다.
+    """
+    def __init__(self, archive: TrafficArchive, time_scale: float = 1.0, row_multiplier: int = 1):
+        """
+        Args:
+            archive (TrafficArchive): 재생할 아카이브
+            time_scale (float): 기록된 응답 시간에 곱할 배율 (0이면 대기 없음)
+            row_multiplier (int): 차원이 있는 행을 몇 배로 늘려 재생할지
+        """
+        self.time_scale = time_scale
+        self.row_multiplier = row_multiplier
+        self._by_key = defaultdict(list)
+        self._by_method = defaultdict(list)
+        self._cursors = defaultdict(int)
+        self._lock = threading.Lock()
+
+        for entry in archive.entries:
+            if entry['kind'] == 'ga':
+                self._by_key[entry['key']].append(entry)
+                self._by_method[entry['method']].append(entry)
+
+    def run_report(self, request, **kwargs):
+        return self._replay('run_report', request)
+
+    def batch_run_reports(self, request, **kwargs):
+        return self._replay('batch_run_reports', request)
+
+    def run_realtime_report(self, request, **kwargs):
+        return self._replay('run_realtime_report', request)
+
+    def _replay(self, method: str, request):
+        key = _request_key(request)
+        with self._lock:
+            if self._by_key.get(key):
+                cursor_key, candidates = ('key', key), self._by_key[key]
+            elif self._by_method.get(method):
+                print(f"일치하는 GA 기록이 없어 같은 메서드 기록으로 대신 재생합니다: {method}")
+                cursor_key, candidates = ('method', method), self._by_method[method]
+            else:
+                raise LookupError(f"재생할 GA 기록이 없습니다: {method}")
+
+            index = self._cursors[cursor_key]
+            self._cursors[cursor_key] = index + 1
+            entry = candidates[index % len(candidates)]
+
+        if self.time_scale:
+            time.sleep(entry['elapsed'] * self.time_scale)
+
+        response = _decode_message(entry['response'])
+        if self.row_multiplier > 1:
+            _multiply_rows(response, self.row_multiplier)
+        return response
+
+
+def _multiply_rows(response, multiplier: int) -> None:
+    """
+    응답의 차원 행을 복제해 행 수를 늘립니다.
+    복제한 행의 차원 값에는 " #n" 접미사를 붙여 서로 다른 행이 되게 합니다.
+    """
+    if isinstance(response, types.BatchRunReportsResponse):
+        for report in response.reports:
+            _multiply_rows(report, multiplier)
+        return
+
+    extra_rows = []
+    for row in response.rows:
+        if not row.dimension_values:
+            continue
+        for i in range(1, multiplier):
+            extra_rows.append(types.Row(
+                dimension_values=[types.DimensionValue(value=f"{value.value} #{i}") for value in row.dimension_values],
+                metric_values=list(row.metric_values)
+            ))
+
+    if extra_rows:
+        response.rows.extend(extra_rows)
+        response.row_count = response.row_count * multiplier
+
+
+def _body_key(body) -> str:
+    """
+    노션 요청 본문으로 재생 시 응답을 찾을 키를 만듭니다.
+    """
+    encoded = json.dumps(body, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha1(encoded.encode('utf-8')).hexdigest()
+
+
+def _is_streamed_body(data) -> bool:
+    """
+    요청 본문이 조각 단위로 만들어지는 이터레이터인지 확인합니다.
+    """
+    return data is not None and not isinstance(data, (bytes, str, dict, list, tuple))
+
+
+class RecordingSession(requests.Session):
+    """
+    노션 API HTTP 통신을 기록하는 requests 세션입니다.
+    """
+    def __init__(self, archive: TrafficArchive):
+        """
+        Args:
+            archive (TrafficArchive): 기록을 저장할 아카이브
+        """
+        super().__init__()
+        self.archive = archive
+
+    def request(self, method, url, **kwargs):
+        body = kwargs.get('json')
+        if _is_streamed_body(kwargs.get('data')):
+            # 스트리밍 본문은 한 번만 읽을 수 있으므로 기록용으로 먼저 모음
+            kwargs['data'] = b''.join(kwargs['data'])
+        if isinstance(kwargs.get('data'), bytes):
+            body = json.loads(kwargs['data'])
+
+        start = time.perf_counter()
+        response = super().request(method, url, **kwargs)
+        elapsed = time.perf_counter() - start
+
+        self.archive.add({
+            'kind': 'http',
+            'method': method,
+            'url': url,
+            'params': kwargs.get('params'),
+            'body': body,
+            'status': response.status_code,
+            'response': response.text,
+            'elapsed': elapsed
+        })
+        return response
+
+
+class ReplaySession(requests.Session):
+    """
+    기록된 노션 응답을 재생하는 requests 세션입니다.
+
+    메서드, URL, 요청 본문이 모두 같은 기록을 우선 사용하고(날짜가 제목에 들어가는 페이지 생성 등),
+    없으면 같은 메서드와 URL, 그다음 같은 메서드의 기록을 순서대로 사용합니다.
+    병렬 실행으로 요청 순서가 기록과 달라져도 본문이 같은 요청은 같은 응답을 받습니다.
+    """
+    def __init__(self, archive: TrafficArchive, time_scale: float = 1.0):
+        """
+        Args:
+            archive (TrafficArchive): 재생할 아카이브
+            time_scale (float): 기록된 응답 시간에 곱할 배율 (0이면 대기 없음)
+        """
+        super().__init__()
+        self.time_scale = time_scale
+        self._by_body = defaultdict(list)
+        self._by_url = defaultdict(list)
+        self._by_method = defaultdict(list)
+        self._cursors = defaultdict(int)
+        self._lock = threading.Lock()
+
+        for entry in archive.entries:
+            if entry['kind'] == 'http':
+                self._by_body[(entry['method'], entry['url'], _body_key(entry['body']))].append(entry)
+                self._by_url[(entry['method'], entry['url'])].append(entry)
+                self._by_method[entry['method']].append(entry)
+
+    def request(self, method, url, **kwargs):
+        body = kwargs.get('json')
+        if _is_streamed_body(kwargs.get('data')):
+            # 실제 전송과 같은 인코딩 비용이 들도록 본문을 끝까지 소비
+            body = json.loads(b''.join(kwargs['data']))
+        elif isinstance(kwargs.get('data'), bytes):
+            body = json.loads(kwargs['data'])
+        body_key = (method, url, _body_key(body))
+
+        with self._lock:
+            if self._by_body.get(body_key):
+                cursor_key, candidates = ('body',) + body_key, self._by_body[body_key]
+            elif self._by_url.get((method, url)):
+                print(f"본문이 일치하는 노션 기록이 없어 같은 URL 기록으로 대신 재생합니다: {method} {url}")
+                cursor_key, candidates = ('url', method, url), self._by_url[(method, url)]
+            elif self._by_method.get(method):
+                print(f"일치하는 노션 기록이 없어 같은 메서드 기록으로 대신 재생합니다: {method} {url}")
+                cursor_key, candidates = ('method', method), self._by_method[method]
+            else:
+                raise LookupError(f"재생할 노션 기록이 없습니다: {method} {url}")
+
+            index = self._cursors[cursor_key]
+            self._cursors[cursor_key] = index + 1
+            entry = candidates[index % len(candidates)]
+
+        if self.time_scale:
+            time.sleep(entry['elapsed'] * self.time_scale)
+
+        response = requests.Response()
+        response.status_code = entry['status']
+        response._content = entry['response'].encode('utf-8')
+        response.encoding = 'utf-8'
+        response.headers['Content-Type'] = 'application/json'
+        response.url = url
+        return response
+
+
+def main():
+    """
+    기록 파일을 재생해 기록할 때와 같은 파이프라인(main.run_command)을 네트워크 없이 실행합니다.
+    기록한 명령행 인자, 기준 날짜, GA 속성 ID를 그대로 사용하므로 GA 요청은 내용으로 정확히 대응됩니다.
+    """
+    import os
+    import tempfile
+    import datetime
+    from ga_client import GoogleAnalyticsClient
+    from notion_client import NotionClient
+    from run_journal import RunJournal
+    from main import build_parser, run_command
+
+    parser = argparse.ArgumentParser(description="기록된 GA/노션 통신으로 리포트 생성을 재생합니다.")
+    parser.add_argument('archive', help="기록 파일 경로 (main.py --record로 생성)")
+    parser.add_argument('--time-scale', type=float, default=1.0, help="기록된 응답 시간 배율 (0이면 대기 없음)")
+    parser.add_argument('--row-multiplier', type=int, default=1, help="GA 응답 행 수 배율")
+    parser.add_argument('--runs', type=int, default=1, help="반복 실행 횟수")
+    args = parser.parse_args()
+
+    archive = TrafficArchive.load(args.archive)
+    meta = archive.meta
+    run_args = build_parser().parse_args(meta.get('argv', []))
+    if run_args.realtime:
+        print("실시간 모드 기록은 재생할 수 없습니다.")
+        return
+
+    # 재생은 실제 실행 기록 파일을 건드리지 않음 (기록 시작 시점의 실행 기록은 임시 파일로 복원)
+    run_args.no_journal = meta.get('journal') is None
+    today = datetime.date.fromisoformat(meta['today']) if meta.get('today') else None
+    property_id = meta.get('property_id') or _recorded_property_id(archive)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        start = time.perf_counter()
+        for _ in range(args.runs):
+            # 매 실행을 기록 시작 시점의 렌더링 정보에서 시작
+            render_store_path = None
+            if meta.get('renders') is not None:
+                render_store_path = os.path.join(workdir, 'notion_renders.json')
+                with open(render_store_path, 'w', encoding='utf-8') as f:
+                    json.dump(meta['renders'], f, ensure_ascii=False)
+            if not run_args.no_journal:
+                run_args.journal = os.path.join(workdir, 'run_journal.db')
+                if os.path.exists(run_args.journal):
+                    os.remove(run_args.journal)
+                journal = RunJournal(run_args.journal)
+                journal.restore(meta['journal'])
+                journal.close()
+
+            ga_client = GoogleAnalyticsClient(
+                property_id=property_id,
+                client=ReplayGAClient(archive, time_scale=args.time_scale, row_multiplier=args.row_multiplier),
+                sections=run_args.sections,
+                memory_bounded=run_args.memory_bounded
+            )
+            notion_client = NotionClient(
+                token='replay',
+                parent_page_id=meta.get('parent_page_id', 'replay'),
+                render_store_path=render_store_path,
+                session=ReplaySession(archive, time_scale=args.time_scale)
+            )
+            run_command(ga_client, notion_client, run_args, today=today)
+        elapsed = time.perf_counter() - start
+
+    print(f"재생 완료: {args.runs}회, {elapsed:.3f}초 (1회 평균 {elapsed / args.runs:.3f}초)")
+
+
+def _recorded_property_id(archive: TrafficArchive) -> str:
+    """
+    실행 조건이 없는 예전 기록 파일에서 GA 요청의 속성 ID를 읽습니다.
+    """
+    for entry in archive.entries:
+        if entry['kind'] == 'ga':
+            prop = getattr(_decode_message(entry['request']), 'property', '')
+            if prop:
+                return prop.split('/')[-1]
+    return 'replay'
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,352 @@
+# report_registry.py
+# GA 분석 섹션을 선언적으로 정의하고, 여러 섹션을 최소한의 GA 요청으로 묶어 실행하는 모듈
+
+from typing import Dict, Any, List, Optional, Tuple, Callable, Iterable, Iterator
+
+from google.analytics.data_v1beta.types import (
+    RunReportRequest, DateRange, Metric, Dimension, OrderBy, Filter, FilterExpression
+)
+from row_table import RowTable
+
+# GA Data API 요청 하나에 넣을 수 있는 최대 지표 수
+MAX_METRICS_PER_REQUEST = 10
+
+# batchRunReports 한 번에 넣을 수 있는 최대 요청 수
+MAX_REQUESTS_PER_BATCH = 5
+
+
+class ReportDefinition:
+    """
+    GA 분석 섹션 하나의 정의입니다.
+    조회할 차원/지표, 정렬, 개수 제한, 필터와 노션 섹션 렌더러를 담습니다.
+    """
+    def __init__(self, name: str, title: str, dimensions: List[str], metrics: List[str],
+                 order_by: Optional[str] = None, desc: bool = True, limit: Optional[int] = None,
+                 dimension_filter: Optional[Tuple[str, str, str]] = None,
+                 metric_labels: Optional[Dict[str, str]] = None,
+                 renderer: Optional[Callable[['ReportDefinition', Iterable[Dict[str, Any]]], Iterable[Dict[str, Any]]]] = None):
+        """
+        Args:
+            name (str): 섹션 이름 (레지스트리 키)
+            title (str): 노션 섹션 제목
+            dimensions (list): GA 차원 이름 목록
+            metrics (list): GA 지표 이름 목록
+            order_by (str, optional): 정렬 기준 지표 또는 차원 이름
+            desc (bool): 내림차순 정렬 여부
+            limit (int, optional): 최대 행 수
+            dimension_filter (tuple, optional): (필드 이름, 일치 방식, 값), 예: ('pagePath', 'CONTAINS', '/category/')
+            metric_labels (dict, optional): 지표별 노션 표시 이름
+            renderer (callable, optional): (정의, 행 목록)을 받아 노션 블록을 차례로 만들어 내는 함수
+
+        Raises:
+            ValueError: 지표 수가 GA 요청 하나의 최대 지표 수를 넘는 경우
+        """
+        # 요청 계획에서 정의 하나는 나누지 않으므로, GA가 거절할 정의는 정의할 때 막음
+        if len(metrics) > MAX_METRICS_PER_REQUEST:
+            raise ValueError(f"분석 섹션 '{name}'의 지표가 {len(metrics)}개입니다. "
+                             f"요청 하나에 최대 {MAX_METRICS_PER_REQUEST}개까지 넣을 수 있습니다.")
+        self.name = name
+        self.title = title
+        self.dimensions = list(dimensions)
+        self.metrics = list(metrics)
+        self.order_by = order_by
+        self.desc = desc
+        self.limit = limit
+        self.dimension_filter = dimension_filter
+        self.metric_labels = metric_labels or {}
+        self.renderer = renderer or render_list_section
+
+    def build_request(self, property_id: str, start_date: str, end_date: str) -> RunReportRequest:
+        """
+        이 정의 하나만으로 GA 요청을 만듭니다.
+        """
+        return _build_request(property_id, start_date, end_date, self.dimensions, self.metrics,
+                              self.order_by, self.desc, self.limit, self.dimension_filter)
+
+    def render(self, rows: Iterable[Dict[str, Any]]) -> Iterable[Dict[str, Any]]:
+        """
+        조회한 행으로 노션 블록을 만듭니다. 기본 렌더러는 블록을 하나씩 만들어 내는 제너레이터입니다.
+        """
+        return self.renderer(self, rows)
+
+
+class PlannedRequest:
+    """
+    여러 정의를 합친 GA 요청 하나입니다.
+    """
+    def __init__(self, dimensions: List[str], dimension_filter: Optional[Tuple[str, str, str]],
+                 definitions: List[ReportDefinition]):
+        self.dimensions = dimensions
+        self.dimension_filter = dimension_filter
+        self.definitions = definitions
+        self.metrics = []
+        for definition in definitions:
+            for metric in definition.metrics:
+                if metric not in self.metrics:
+                    self.metrics.append(metric)
+
+        # 정렬이 같은 정의끼리만 개수 제한을 유지할 수 있음
+        orders = {(definition.order_by, definition.desc) for definition in definitions}
+        limits = [definition.limit for definition in definitions]
+        if len(orders) == 1 and None not in limits:
+            self.order_by, self.desc = orders.pop()
+            self.limit = max(limits)
+        else:
+            self.order_by, self.desc, self.limit = None, True, None
+
+    def build_request(self, property_id: str, start_date: str, end_date: str) -> RunReportRequest:
+        return _build_request(property_id, start_date, end_date, self.dimensions, self.metrics,
+                              self.order_by, self.desc, self.limit, self.dimension_filter)
+
+
+# 등록된 분석 섹션 (등록 순서대로 노션에 표시)
+REPORTS: Dict[str, ReportDefinition] = {}
+
+
+def register(definition: ReportDefinition) -> ReportDefinition:
+    """
+    분석 섹션을 레지스트리에 등록합니다.
+    """
+    REPORTS[definition.name] = definition
+    return definition
+
+
+def plan_requests(definitions: List[ReportDefinition]) -> List[PlannedRequest]:
+    """
+    정의들을 가능한 한 적은 GA 요청으로 묶습니다.
+
+    차원과 필터가 같은 정의는 지표를 합쳐 한 요청으로 조회합니다.
+    단, 개수 제한이 있는 정의는 정렬이 같은 정의와만 합칩니다 (다른 정렬의 상위 N개는 잘린 결과로 알 수 없음).
+    지표가 요청당 최대 개수를 넘으면 나누어 조회합니다.
+
+    Args:
+        definitions (list): 실행할 정의 목록
+
+    Returns:
+        list: PlannedRequest 목록
+    """
+    groups: Dict[Any, List[ReportDefinition]] = {}
+    for definition in definitions:
+        order_key = (definition.order_by, definition.desc) if definition.limit else None
+        key = (tuple(definition.dimensions), definition.dimension_filter, order_key)
+        groups.setdefault(key, []).append(definition)
+
+    plans = []
+    for (dimensions, dimension_filter, _), members in groups.items():
+        batch = []
+        metrics = set()
+        for definition in members:
+            merged = metrics | set(definition.metrics)
+            if batch and len(merged) > MAX_METRICS_PER_REQUEST:
+                plans.append(PlannedRequest(list(dimensions), dimension_filter, batch))
+                batch, merged = [], set(definition.metrics)
+            batch.append(definition)
+            metrics = merged
+        plans.append(PlannedRequest(list(dimensions), dimension_filter, batch))
+
+    return plans
+
+
+def decode_rows(response, dimensions: List[str], metrics: List[str]) -> List[Dict[str, Any]]:
+    """
+    GA 응답을 {차원/지표 이름: 값} 딕셔너리 목록으로 변환합니다.
+    """
+    rows = []
+    for row in response.rows:
+        decoded = {name: value.value for name, value in zip(dimensions, row.dimension_values)}
+        for name, value in zip(metrics, row.metric_values):
+            decoded[name] = _parse_metric(value.value)
+        rows.append(decoded)
+    return rows
+
+
+def select_rows(definition: ReportDefinition, rows):
+    """
+    합쳐서 조회한 행에서 정의에 필요한 열만 골라 정렬하고 개수를 제한합니다.
+    RowTable이면 열을 복사하지 않는 RowTable을 반환합니다.
+    """
+    columns = definition.dimensions + definition.metrics
+    if isinstance(rows, RowTable):
+        return rows.select(columns, definition.order_by, definition.desc, definition.limit)
+
+    selected = [{column: row[column] for column in columns} for row in rows]
+
+    if definition.order_by:
+        selected.sort(key=lambda row: row[definition.order_by], reverse=definition.desc)
+    if definition.limit:
+        selected = selected[:definition.limit]
+    return selected
+
+
+def render_list_section(definition: ReportDefinition, rows: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """
+    기본 섹션 렌더러: 제목과 행별 글머리 기호 목록을 만듭니다.
+    예) "mobile: 활성 사용자 120명 · 세션 150회 · 참여율 55.2%"
+    행이 많아도 블록 목록 전체를 메모리에 두지 않도록 블록을 하나씩 만들어 냅니다.
+    """
+    yield {
+        "object": "block",
+        "type": "heading_3",
+        "heading_3": {
+            "rich_text": [
+                {
+                    "type": "text",
+                    "text": {
+                        "content": f"[ {definition.title} ]"
+                    }
+                }
+            ]
+        }
+    }
+
+    for row in rows:
+        label = " / ".join(str(row[dimension]) for dimension in definition.dimensions)
+        values = " · ".join(
+            f"{definition.metric_labels.get(metric, metric)} {_format_metric(metric, row[metric])}"
+            for metric in definition.metrics
+        )
+        yield {
+            "object": "block",
+            "type": "bulleted_list_item",
+            "bulleted_list_item": {
+                "rich_text": [
+                    {
+                        "type": "text",
+                        "text": {
+                            "content": f"{label}:"
+                        },
+                        "annotations": {
+                            "bold": True
+                        }
+                    },
+                    {
+                        "type": "text",
+                        "text": {
+                            "content": f" {values}"
+                        }
+                    }
+                ]
+            }
+        }
+
+    # 빈 줄 추가
+    yield {
+        "object": "block",
+        "type": "paragraph",
+        "paragraph": {
+            "rich_text": []
+        }
+    }
+
+
+def _build_request(property_id, start_date, end_date, dimensions, metrics, order_by, desc, limit, dimension_filter):
+    """
+    정의 내용으로 RunReportRequest를 만듭니다.
+    """
+    request = RunReportRequest(
+        property=f'properties/{property_id}',
+        date_ranges=[DateRange(start_date=start_date, end_date=end_date)],
+        dimensions=[Dimension(name=name) for name in dimensions],
+        metrics=[Metric(name=name) for name in metrics]
+    )
+
+    if order_by in metrics:
+        request.order_bys = [OrderBy(metric=OrderBy.MetricOrderBy(metric_name=order_by), desc=desc)]
+    elif order_by:
+        request.order_bys = [OrderBy(dimension=OrderBy.DimensionOrderBy(dimension_name=order_by), desc=desc)]
+
+    if limit:
+        request.limit = limit
+
+    if dimension_filter:
+        field_name, match_type, value = dimension_filter
+        request.dimension_filter = FilterExpression(
+            filter=Filter(
+                field_name=field_name,
+                string_filter=Filter.StringFilter(
+                    match_type=Filter.StringFilter.MatchType[match_type],
+                    value=value
+                )
+            )
+        )
+
+    return request
+
+
+def _parse_metric(value: str):
+    """
+    GA 지표 문자열을 숫자로 변환합니다.
+    """
+    try:
+        return int(value)
+    except ValueError:
+        return float(value)
+
+
+def _format_metric(metric: str, value) -> str:
+    """
+    지표 이름에 맞게 값을 표시용 문자열로 바꿉니다.
+    """
+    if metric.endswith('Rate'):
+        return f"{value * 100:.1f}%"
+    if metric.endswith('Duration'):
+        return f"{value:,.0f}초"
+    if isinstance(value, float):
+        return f"{value:,.2f}"
+    return f"{value:,}"
+
+
+register(ReportDefinition(
+    name='device_stats',
+    title='디바이스별 사용자',
+    dimensions=['deviceCategory'],
+    metrics=['activeUsers', 'sessions', 'engagementRate'],
+    metric_labels={'activeUsers': '활성 사용자', 'sessions': '세션', 'engagementRate': '참여율'}
+))
+
+register(ReportDefinition(
+    name='new_vs_returning',
+    title='신규 / 재방문',
+    dimensions=['newVsReturningUser'],
+    metrics=['activeUsers', 'sessions', 'engagementRate', 'screenPageViewsPerSession'],
+    metric_labels={'activeUsers': '활성 사용자', 'sessions': '세션', 'engagementRate': '참여율',
+                   'screenPageViewsPerSession': '세션당 조회'}
+))
+
+register(ReportDefinition(
+    name='content_performance',
+    title='콘텐츠 성과',
+    dimensions=['pageTitle', 'pagePath'],
+    metrics=['screenPageViews', 'userEngagementDuration', 'engagementRate'],
+    order_by='screenPageViews',
+    limit=10,
+    metric_labels={'screenPageViews': '조회', 'userEngagementDuration': '참여 시간', 'engagementRate': '참여율'}
+))
+
+register(ReportDefinition(
+    name='content_engagement',
+    title='체류 시간 Top 10',
+    dimensions=['pageTitle'],
+    metrics=['userEngagementDuration', 'screenPageViews', 'engagementRate'],
+    order_by='userEngagementDuration',
+    limit=10,
+    metric_labels={'userEngagementDuration': '참여 시간', 'screenPageViews': '조회', 'engagementRate': '참여율'}
+))
+
+register(ReportDefinition(
+    name='detailed_traffic_sources',
+    title='채널별 트래픽',
+    dimensions=['sessionDefaultChannelGroup', 'sessionSource', 'sessionMedium'],
+    metrics=['sessions', 'activeUsers', 'engagementRate'],
+    order_by='sessions',
+    metric_labels={'sessions': '세션', 'activeUsers': '활성 사용자', 'engagementRate': '참여율'}
+))
+
+register(ReportDefinition(
+    name='category_performance',
+    title='카테고리별 성과',
+    dimensions=['pagePath'],
+    metrics=['screenPageViews', 'activeUsers', 'engagementRate'],
+    dimension_filter=('pagePath', 'CONTAINS', '/category/'),
+    metric_labels={'screenPageViews': '조회', 'activeUsers': '활성 사용자', 'engagementRate': '참여율'}
+))
@@ -0,0 +1,103 @@
+# row_table.py
+# 대용량 GA 리포트 행을 열 단위 배열로 저장하는 모듈
+
+from array import array
+from typing import Dict, Any, List, Optional, Iterator
+
+
+class RowTable:
+    """
+    GA 리포트 행을 열 단위로 저장하는 표입니다.
+
+    차원 값은 같은 문자열을 공유하는 리스트, 지표 값은 array('q') / array('d')에 담아
+    행마다 딕셔너리와 숫자 객체를 만드는 것보다 메모리를 크게 줄입니다.
+    select()로 만든 표는 열을 복사하지 않고 원본과 공유하며, 정렬 결과는 행 번호 배열로만 가집니다.
+    순회할 때는 행마다 임시 딕셔너리를 만들어 기존 행 목록과 같은 방식으로 사용할 수 있습니다.
+    """
+    __slots__ = ('dimensions', 'metrics', '_columns', '_strings', '_order', '_size')
+
+    def __init__(self, dimensions: List[str], metrics: List[str]):
+        """
+        Args:
+            dimensions (list): 차원 이름 목록
+            metrics (list): 지표 이름 목록
+        """
+        self.dimensions = list(dimensions)
+        self.metrics = list(metrics)
+        self._columns: Dict[str, Any] = {name: [] for name in self.dimensions}
+        self._columns.update({name: None for name in self.metrics})
+        self._strings: Dict[str, str] = {}
+        self._order: Optional[array] = None
+        self._size = 0
+
+    def append_row(self, row) -> None:
+        """
+        GA 응답 행 하나를 추가합니다.
+        """
+        strings = self._strings
+        for name, value in zip(self.dimensions, row.dimension_values):
+            text = value.value
+            self._columns[name].append(strings.setdefault(text, text))
+
+        for name, value in zip(self.metrics, row.metric_values):
+            self._append_metric(name, value.value)
+
+        self._size += 1
+
+    def select(self, columns: List[str], order_by: Optional[str] = None, desc: bool = True,
+               limit: Optional[int] = None) -> 'RowTable':
+        """
+        일부 열만 보이는 표를 만듭니다. 열 데이터는 복사하지 않습니다.
+
+        Args:
+            columns (list): 포함할 차원/지표 이름
+            order_by (str, optional): 정렬 기준 열
+            desc (bool): 내림차순 정렬 여부
+            limit (int, optional): 최대 행 수
+
+        Returns:
+            RowTable: 열을 공유하는 새 표
+        """
+        view = RowTable.__new__(RowTable)
+        view.dimensions = [name for name in self.dimensions if name in columns]
+        view.metrics = [name for name in self.metrics if name in columns]
+        view._columns = {name: self._columns[name] for name in view.dimensions + view.metrics}
+        view._strings = self._strings
+
+        order = self._order if self._order is not None else range(self._size)
+        if order_by:
+            column = self._columns[order_by]
+            order = sorted(order, key=column.__getitem__, reverse=desc)
+        if limit is not None:
+            order = order[:limit]
+
+        view._order = array('l', order) if order_by or limit is not None or self._order is not None else None
+        view._size = len(order)
+        return view
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        names = self.dimensions + self.metrics
+        columns = [self._columns[name] for name in names]
+        indices = self._order if self._order is not None else range(self._size)
+        for i in indices:
+            yield {name: column[i] for name, column in zip(names, columns)}
+
+    def _append_metric(self, name: str, text: str) -> None:
+        """
+        지표 값을 추가합니다. 정수 열에 소수가 들어오면 실수 열로 바꿉니다.
+        """
+        column = self._columns[name]
+        try:
+            value = int(text)
+        except ValueError:
+            value = float(text)
+
+        if column is None:
+            column = self._columns[name] = array('q' if isinstance(value, int) else 'd')
+        elif column.typecode == 'q' and isinstance(value, float):
+            column = self._columns[name] = array('d', column)
+        column.append(value)
+
@@ -0,0 +1,123 @@
+# run_journal.py
+# GA → 노션 파이프라인의 진행 단계를 기록해 중단된 작업을 이어서 실행하게 하는 모듈
+
+import json
+import sqlite3
+import datetime
+import threading
+from typing import Any, Optional
+
+# 파이프라인 단계 (속성, 날짜별로 순서대로 진행)
+STAGE_GA_FETCHED = 'ga_fetched'          # GA 데이터 조회 완료 (payload: GA 데이터)
+STAGE_BLOCKS_BUILT = 'blocks_built'      # 노션 블록 생성 완료 (payload: (키, 블록) 목록)
+STAGE_PAGE_CREATED = 'page_created'      # 노션 페이지 생성 완료 (payload: 페이지 ID와 포함된 블록 수)
+STAGE_BLOCKS_APPENDED = 'blocks_appended'  # 나머지 블록 추가 진행 (payload: 페이지에 들어간 블록 수)
+
+
+class RunJournal:
+    """
+    SQLite에 (속성, 날짜, 단계)별 진행 상황과 중간 결과를 저장하는 실행 기록입니다.
+    각 단계는 기록 즉시 커밋되므로 프로세스가 중간에 종료되어도 완료된 단계는 남습니다.
+    """
+    def __init__(self, path: str):
+        """
+        Args:
+            path (str): SQLite 파일 경로 (':memory:'이면 파일 없이 이번 실행 안에서만 기록)
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS stages (
+                property_id TEXT NOT NULL,
+                date TEXT NOT NULL,
+                stage TEXT NOT NULL,
+                payload TEXT,
+                updated_at TEXT NOT NULL,
+                PRIMARY KEY (property_id, date, stage)
+            )
+        ''')
+        self._conn.commit()
+
+    def get(self, property_id: str, date: str, stage: str) -> Optional[Any]:
+        """
+        완료된 단계의 중간 결과를 가져옵니다.
+
+        Args:
+            property_id (str): GA 속성 ID
+            date (str): 리포트 날짜 (YYYY-MM-DD)
+            stage (str): 단계 이름
+
+        Returns:
+            단계의 payload, 기록이 없으면 None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT payload FROM stages WHERE property_id = ? AND date = ? AND stage = ?',
+                (str(property_id), date, stage)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def record(self, property_id: str, date: str, stage: str, payload: Any) -> None:
+        """
+        단계 완료와 중간 결과를 기록합니다.
+
+        Args:
+            property_id (str): GA 속성 ID
+            date (str): 리포트 날짜 (YYYY-MM-DD)
+            stage (str): 단계 이름
+            payload: JSON으로 저장할 중간 결과
+        """
+        encoded = json.dumps(payload, ensure_ascii=False)
+        now = datetime.datetime.now().isoformat(timespec='seconds')
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO stages (property_id, date, stage, payload, updated_at) VALUES (?, ?, ?, ?, ?)',
+                (str(property_id), date, stage, encoded, now)
+            )
+            self._conn.commit()
+
+    def snapshot(self) -> list:
+        """
+        모든 기록을 JSON으로 저장할 수 있는 목록으로 꺼냅니다 (통신 기록과 함께 보관해 재생할 때 복원).
+
+        Returns:
+            list: [속성 ID, 날짜, 단계, payload] 목록
+        """
+        with self._lock:
+            rows = self._conn.execute('SELECT property_id, date, stage, payload FROM stages').fetchall()
+        return [[property_id, date, stage, json.loads(payload)] for property_id, date, stage, payload in rows]
+
+    def restore(self, rows: list) -> None:
+        """
+        snapshot()으로 꺼낸 기록을 다시 넣습니다.
+
+        Args:
+            rows (list): [속성 ID, 날짜, 단계, payload] 목록
+        """
+        for property_id, date, stage, payload in rows:
+            self.record(property_id, date, stage, payload)
+
+    def prune(self, before: str) -> int:
+        """
+        기준 날짜보다 이전 날짜의 기록을 지우고 파일 크기를 줄입니다.
+
+        Args:
+            before (str): 이 날짜(YYYY-MM-DD)보다 이전 기록을 삭제
+
+        Returns:
+            int: 삭제한 기록 수
+        """
+        with self._lock:
+            deleted = self._conn.execute('DELETE FROM stages WHERE date < ?', (before,)).rowcount
+            self._conn.commit()
+            if deleted:
+                self._conn.execute('VACUUM')
+        return deleted
+
+    def close(self) -> None:
+        """
+        데이터베이스 연결을 닫습니다.
+        """
+        with self._lock:
+            self._conn.close()